@@ -7,41 +7,49 @@ Usage:
     python sql_analyzer.py --file script.sql --db postgres --json --csv --ai
 """
 
+from __future__ import annotations
+
 import argparse
 import logging
+import re
 import sys
-from typing import List
-
-from rich.console import Console
-
-from sql_analyzer.ai_advisor import (
-    get_ai_suggestions,
-    get_groq_suggestions,
-    get_ollama_suggestions,
-)
-from sql_analyzer.config import AnalyzerConfig, DatabaseConfig, setup_logging
-from sql_analyzer.credential_manager import (
-    delete_credentials,
-    prompt_and_save_password,
-)
-from sql_analyzer.db_connector import DatabaseConnector
-from sql_analyzer.executor import BatchResult, QueryResult, execute_all_queries, execute_as_script
-from sql_analyzer.plan_analyzer import analyze_query_plan
-from sql_analyzer.report import (
-    print_batch_result,
-    print_query_detail,
-    print_query_result,
-    print_query_result_compact,
-    print_summary,
-    save_csv_report,
-    save_json_report,
-)
-from sql_analyzer.sql_parser import get_query_type, load_sql_file, split_queries
-from sql_analyzer.suggestions import generate_suggestions
-
-console = Console()
+from typing import TYPE_CHECKING, List
+
+# Heavy imports (rich, sqlparse, dotenv, DB drivers) are deferred into
+# the functions that need them so `--help` and argument errors return in
+# milliseconds instead of paying full package import cost up front.
+if TYPE_CHECKING:
+    from sql_analyzer.config import AnalyzerConfig, DatabaseConfig
+    from sql_analyzer.executor import QueryResult
+
 logger = logging.getLogger(__name__)
 
+_console = None
+
+# Compiled per-variable patterns for rewriting KEY=value lines in .env.
+# MULTILINE anchors are required so a key on any line matches, not just
+# the first; the variable name is escaped before compilation.
+_ENV_LINE_CACHE: dict = {}
+
+
+def _env_re(var: str) -> "re.Pattern":
+    """Return a cached compiled pattern matching ``var=...`` lines."""
+    pattern = _ENV_LINE_CACHE.get(var)
+    if pattern is None:
+        pattern = re.compile(rf"^{re.escape(var)}=.*$", re.MULTILINE)
+        _ENV_LINE_CACHE[var] = pattern
+    return pattern
+
+
+def _get_console():
+    """Return the shared Rich console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
 
 def build_arg_parser() -> argparse.ArgumentParser:
     """Build the CLI argument parser.
@@ -122,6 +130,39 @@ def build_arg_parser() -> argparse.ArgumentParser:
         default=300.0,
         help="Only show execution plan/AI for queries slower than this (ms, default: 300).",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-run the analysis even if a cached report exists for "
+        "this unchanged SQL file and database configuration.",
+    )
+    parser.add_argument(
+        "--force-ai",
+        action="store_true",
+        help="Analyze every SELECT even below the interest threshold "
+        "(by default cheap queries skip plan analysis and AI, like "
+        "Postgres' jit_above_cost heuristic).",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=4,
+        help="Worker threads for plan analysis and AI calls (default: 4).",
+    )
+    parser.add_argument(
+        "--batch-identical",
+        action="store_true",
+        help="Execute contiguous runs of identically-shaped INSERT/UPDATE/DELETE "
+        "statements in one round trip each (reported time is the batch average).",
+    )
+    parser.add_argument(
+        "--commit-every",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Commit once per N mutating statements instead of per statement "
+        "(default: 1). A failure rolls back the whole uncommitted group.",
+    )
     parser.add_argument(
         "--batch",
         action="store_true",
@@ -156,6 +197,13 @@ def build_arg_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Disable colored output.",
     )
+    parser.add_argument(
+        "--summary-only",
+        action="store_true",
+        help="Only print queries with findings (failures, slow queries, "
+        "warnings, or suggestions) plus the summary — skips the "
+        "per-query output for clean fast queries.",
+    )
 
     # AI settings
     parser.add_argument(
@@ -233,6 +281,14 @@ def build_configs(args: argparse.Namespace) -> tuple[DatabaseConfig, AnalyzerCon
     Returns:
         Tuple of (DatabaseConfig, AnalyzerConfig).
     """
+    from sql_analyzer.config import AnalyzerConfig, DatabaseConfig
+    from sql_analyzer.credential_manager import (
+        delete_credentials,
+        prompt_and_save_password,
+    )
+
+    console = _get_console()
+
     # Start from environment, then override with CLI args
     db_config = DatabaseConfig.from_env(db_type=args.db)
     analyzer_config = AnalyzerConfig.from_env()
@@ -291,12 +347,19 @@ def build_configs(args: argparse.Namespace) -> tuple[DatabaseConfig, AnalyzerCon
     analyzer_config.slow_query_threshold_ms = args.slow_threshold
     analyzer_config.interest_threshold_ms = args.interest_threshold
     analyzer_config.batch_mode = args.batch
+    analyzer_config.max_workers = max(1, args.max_workers)
+    if args.batch_identical:
+        analyzer_config.batch_identical = True
+    analyzer_config.commit_every = max(1, args.commit_every)
+    analyzer_config.force_ai = args.force_ai
+    analyzer_config.force_refresh = args.force
     analyzer_config.continue_on_error = not args.stop_on_error
     analyzer_config.save_json = args.save_json
     analyzer_config.json_output_path = args.json_path
     analyzer_config.save_csv = args.save_csv
     analyzer_config.csv_output_path = args.csv_path
     analyzer_config.colored_output = not args.no_color
+    analyzer_config.summary_only = args.summary_only
     analyzer_config.log_level = args.log_level
     analyzer_config.log_file = args.log_file
 
@@ -369,6 +432,8 @@ def _prompt_for_api_key(
     import getpass
     from pathlib import Path
 
+    console = _get_console()
+
     console.print(
         f"\n[bold yellow]{provider} API key required for AI suggestions.[/bold yellow]"
     )
@@ -394,12 +459,7 @@ def _prompt_for_api_key(
 
         if env_var in existing:
             # Replace existing key
-            import re
-            updated = re.sub(
-                rf"{env_var}=.*",
-                f"{env_var}={api_key}",
-                existing,
-            )
+            updated = _env_re(env_var).sub(f"{env_var}={api_key}", existing)
             env_path.write_text(updated, encoding="utf-8")
         else:
             # Append to file
@@ -430,6 +490,26 @@ def run_analysis(
     Returns:
         List of QueryResult objects.
     """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from sql_analyzer.db_connector import ConnectionPool, DatabaseConnector
+    from sql_analyzer.executor import execute_all_queries, execute_as_script
+    from sql_analyzer.plan_analyzer import analyze_query_plan
+    from sql_analyzer.report import (
+        print_batch_result,
+        print_query_result,
+        print_query_result_compact,
+        print_summary,
+    )
+    from sql_analyzer.run_cache import (
+        is_replayable,
+        load_cached_results,
+        save_cached_results,
+    )
+    from sql_analyzer.sql_parser import load_sql_file, split_queries
+    from sql_analyzer.suggestions import generate_suggestions
+
+    console = _get_console()
     colored = analyzer_config.colored_output
 
     # Step 1: Load and parse SQL file
@@ -442,6 +522,31 @@ def run_analysis(
         console.print("[yellow]No executable SQL statements found.[/yellow]")
         return []
 
+    # Replay a cached report when file + config are unchanged (skip with
+    # --force). Only read-only scripts qualify: replaying a file with
+    # DML/DDL would skip the writes while still reporting them as run.
+    replayable = is_replayable(queries)
+    if (
+        replayable
+        and not analyzer_config.batch_mode
+        and not analyzer_config.force_refresh
+    ):
+        cached_results = load_cached_results(sql_file, db_config, analyzer_config)
+        if cached_results is not None:
+            console.print(
+                "[dim]Using cached report for unchanged input "
+                "(pass --force to re-run).[/dim]\n"
+            )
+            for result in cached_results:
+                print_query_result_compact(result, colored=colored)
+            print_summary(cached_results, colored=colored)
+            _interactive_detail_prompt(
+                cached_results,
+                colored=colored,
+                interest_threshold_ms=analyzer_config.interest_threshold_ms,
+            )
+            return cached_results
+
     # Step 2: Connect to database
     connector = DatabaseConnector(db_config)
     try:
@@ -459,6 +564,7 @@ def run_analysis(
         console.print(f"[red]Connection failed: {e}[/red]")
         sys.exit(1)
 
+    pool = None
     try:
         if analyzer_config.batch_mode:
             # ── Batch mode: run entire file as a single script ──
@@ -471,85 +577,102 @@ def run_analysis(
             return []  # No individual QueryResults in batch mode
 
         # ── Normal mode: execute queries individually ──
+        # Read-only pool for EXPLAIN dispatch; the main connector stays
+        # the single writer. Fall back to the writer if pooling fails.
+        pool_size = min(8, analyzer_config.max_workers, len(queries))
+        if db_config.db_type == "postgres":
+            # Pooled connectors draw from the shared driver-level
+            # ThreadedConnectionPool, and the writer already holds one
+            # of its pg_pool_size slots — asking for more would exhaust
+            # the driver pool and abort the open.
+            pool_size = min(pool_size, max(1, db_config.pg_pool_size - 1))
+        try:
+            pool = ConnectionPool(db_config, size=pool_size)
+            pool.open()
+        except (ConnectionError, ImportError) as e:
+            logger.warning("Connection pool unavailable, using single connection: %s", e)
+            pool = None
+
         # Step 3: Execute queries
         results = execute_all_queries(
             connector=connector,
             queries=queries,
             explain_analyze=analyzer_config.explain_analyze,
             continue_on_error=analyzer_config.continue_on_error,
+            pool=pool,
+            batch_identical=analyzer_config.batch_identical,
+            commit_every=analyzer_config.commit_every,
         )
 
-        # Step 4: Analyze plans and generate suggestions
+        # Step 4: Analyze plans and generate suggestions (pass 1)
+        # Post-processing per result is independent, so fan it out across
+        # a small thread pool instead of paying N sequential passes.
+        def _process_one(result: QueryResult) -> bool:
+            """Analyze one result; return True if it qualifies for AI advice."""
+            if not result.success:
+                return False
+
+            # Mark slow queries
+            if result.execution_time_ms > analyzer_config.slow_query_threshold_ms:
+                result.is_slow = True
+
+            # Don't pay for plan parsing or LLM round-trips on queries
+            # below the interest threshold — the jit_above_cost idea:
+            # cheap queries aren't worth the analysis overhead.
+            if (
+                result.execution_time_ms <= analyzer_config.interest_threshold_ms
+                and not analyzer_config.force_ai
+            ):
+                result.performance_score = 10
+                return False
+
+            # Analyze EXPLAIN plan
+            metrics = analyze_query_plan(
+                explain_output=result.explain_output,
+                execution_time_ms=result.execution_time_ms,
+                slow_threshold_ms=analyzer_config.slow_query_threshold_ms,
+                db_type=db_config.db_type,
+            )
+
+            # Generate suggestions
+            warnings, suggestions = generate_suggestions(
+                query=result.query_text,
+                metrics=metrics,
+                slow_threshold_ms=analyzer_config.slow_query_threshold_ms,
+            )
+            result.warnings = warnings
+            result.suggestions = suggestions
+            result.performance_score = metrics.performance_score
+
+            # Queue AI analysis — anything that got this far qualifies
+            return result.query_type == "SELECT"
+
+        workers = min(analyzer_config.max_workers, max(1, len(results)))
+        with ThreadPoolExecutor(max_workers=workers) as worker_pool:
+            eligible = list(worker_pool.map(_process_one, results))
+        ai_candidates = [r for r, ok in zip(results, eligible) if ok]
+
+        # Step 4b: AI suggestions (pass 2) — one batched call instead of N
+        if ai_candidates:
+            _attach_ai_suggestions(ai_candidates, analyzer_config, workers=workers)
+
+        # Step 4c: Print results
+        verbose = not analyzer_config.summary_only
         for result in results:
-            if result.success:
-                # Analyze EXPLAIN plan
-                metrics = analyze_query_plan(
-                    explain_output=result.explain_output,
-                    execution_time_ms=result.execution_time_ms,
-                    slow_threshold_ms=analyzer_config.slow_query_threshold_ms,
-                    db_type=db_config.db_type,
-                )
-
-                # Mark slow queries
-                if result.execution_time_ms > analyzer_config.slow_query_threshold_ms:
-                    result.is_slow = True
-
-                # Generate suggestions
-                warnings, suggestions = generate_suggestions(
-                    query=result.query_text,
-                    metrics=metrics,
-                    slow_threshold_ms=analyzer_config.slow_query_threshold_ms,
-                )
-                result.warnings = warnings
-                result.suggestions = suggestions
-                result.performance_score = metrics.performance_score
-
-                # AI suggestions (if enabled) — only for queries above interest threshold
-                if (
-                    result.query_type == "SELECT"
-                    and result.execution_time_ms > analyzer_config.interest_threshold_ms
-                ):
-                    ai_advice = None
-
-                    if analyzer_config.groq_enabled:
-                        ai_advice = get_groq_suggestions(
-                            query=result.query_text,
-                            explain_output=result.explain_output,
-                            api_key=analyzer_config.groq_api_key,
-                            model=analyzer_config.groq_model,
-                        )
-                    elif analyzer_config.ollama_enabled:
-                        ai_advice = get_ollama_suggestions(
-                            query=result.query_text,
-                            explain_output=result.explain_output,
-                            model=analyzer_config.ollama_model,
-                            host=analyzer_config.ollama_host,
-                        )
-                    elif (
-                        analyzer_config.openai_enabled
-                        and analyzer_config.openai_api_key
-                    ):
-                        ai_advice = get_ai_suggestions(
-                            query=result.query_text,
-                            explain_output=result.explain_output,
-                            api_key=analyzer_config.openai_api_key,
-                            model=analyzer_config.openai_model,
-                        )
-
-                    if ai_advice:
-                        result.suggestions.append(f"[AI] {ai_advice}")
-
-            # Print result
             if analyzer_config.batch_mode:
                 # Batch mode: print full result including plan + AI
-                print_query_result(result, colored=colored)
+                print_query_result(result, colored=colored, verbose=verbose)
             else:
                 # Interactive mode: compact view, details on demand
-                print_query_result_compact(result, colored=colored)
+                print_query_result_compact(result, colored=colored, verbose=verbose)
 
         # Step 5: Print summary
         print_summary(results, colored=colored)
 
+        # Persist for replay on identical future runs (read-only only)
+        if replayable:
+            save_cached_results(sql_file, db_config, analyzer_config, results)
+
         # Step 6: Interactive prompt for query details (skip in batch mode)
         if not analyzer_config.batch_mode:
             _interactive_detail_prompt(
@@ -561,9 +684,104 @@ def run_analysis(
         return results
 
     finally:
+        if pool is not None:
+            pool.close()
         connector.close()
 
 
+def _attach_ai_suggestions(
+    candidates: List[QueryResult],
+    analyzer_config: AnalyzerConfig,
+    workers: int = 4,
+) -> None:
+    """Fetch AI advice for the given results and append it to suggestions.
+
+    Groq and OpenAI backends take a single batched request covering all
+    candidates (one round-trip instead of one per query); Ollama is
+    queried per result, with requests overlapped across worker threads.
+
+    Args:
+        candidates: Successful SELECT results above the interest threshold.
+        analyzer_config: Analyzer settings (backend selection and keys).
+        workers: Worker threads for per-result backends.
+    """
+    # Bind the backend once into a single callable over all pairs —
+    # the enabled flags are stable for the whole run, so there is no
+    # reason to consult them more than once.
+    batch_fn = _select_ai_backend(analyzer_config, workers)
+    if batch_fn is None:
+        return
+
+    pairs = [(r.query_text, r.explain_output) for r in candidates]
+    advice_list = batch_fn(pairs)
+
+    for result, ai_advice in zip(candidates, advice_list):
+        if ai_advice:
+            result.suggestions.append(f"[AI] {ai_advice}")
+
+
+def _select_ai_backend(analyzer_config: AnalyzerConfig, workers: int = 4):
+    """Resolve the enabled AI backend to one pre-bound batch callable.
+
+    Args:
+        analyzer_config: Analyzer settings (backend selection and keys).
+        workers: Worker threads for per-result backends (Ollama).
+
+    Returns:
+        A callable taking a list of (query, explain) pairs and returning
+        a list of advice strings, or None if no backend is enabled.
+    """
+    from functools import partial
+
+    if analyzer_config.groq_enabled:
+        from sql_analyzer.ai_advisor import get_groq_suggestions_batch
+
+        return partial(
+            get_groq_suggestions_batch,
+            api_key=analyzer_config.groq_api_key,
+            model=analyzer_config.groq_model,
+        )
+
+    if analyzer_config.ollama_enabled:
+        from concurrent.futures import ThreadPoolExecutor
+
+        from sql_analyzer.ai_advisor import get_ollama_suggestions
+
+        def _ollama_batch(pairs):
+            ask = partial(
+                _ask_ollama_pair,
+                get_ollama_suggestions,
+                analyzer_config.ollama_model,
+                analyzer_config.ollama_host,
+            )
+            with ThreadPoolExecutor(max_workers=min(workers, len(pairs))) as pool:
+                return list(pool.map(ask, pairs))
+
+        return _ollama_batch
+
+    if analyzer_config.openai_enabled and analyzer_config.openai_api_key:
+        from sql_analyzer.ai_advisor import get_ai_suggestions_batch
+
+        return partial(
+            get_ai_suggestions_batch,
+            api_key=analyzer_config.openai_api_key,
+            model=analyzer_config.openai_model,
+        )
+
+    return None
+
+
+def _ask_ollama_pair(ask_fn, model: str, host: str, pair):
+    """Fetch Ollama advice for one (query, explain) pair."""
+    query, explain_output = pair
+    return ask_fn(
+        query=query,
+        explain_output=explain_output,
+        model=model,
+        host=host,
+    )
+
+
 def _interactive_detail_prompt(
     results: List[QueryResult],
     colored: bool = True,
@@ -578,6 +796,10 @@ def _interactive_detail_prompt(
         colored: Whether to use colored output.
         interest_threshold_ms: Minimum execution time (ms) for a query to be listed.
     """
+    from sql_analyzer.report import print_query_detail
+
+    console = _get_console()
+
     # Build lookup of queries that have plan or AI suggestions AND exceed threshold
     detail_map = {}
     for r in results:
@@ -672,17 +894,22 @@ def main() -> None:
     db_config, analyzer_config = build_configs(args)
 
     # Setup logging
+    from sql_analyzer.config import setup_logging
+
     setup_logging(analyzer_config)
 
     # Run analysis
     results = run_analysis(db_config, analyzer_config, args.file)
 
     # Save reports if requested
-    if analyzer_config.save_json:
-        save_json_report(results, analyzer_config.json_output_path)
+    if analyzer_config.save_json or analyzer_config.save_csv:
+        from sql_analyzer.report import save_csv_report, save_json_report
+
+        if analyzer_config.save_json:
+            save_json_report(results, analyzer_config.json_output_path)
 
-    if analyzer_config.save_csv:
-        save_csv_report(results, analyzer_config.csv_output_path)
+        if analyzer_config.save_csv:
+            save_csv_report(results, analyzer_config.csv_output_path)
 
 
 if __name__ == "__main__":
@@ -4,11 +4,15 @@ Supports OpenAI (cloud), Groq (fast cloud, free tier), and Ollama (local).
 Sends EXPLAIN output to the chosen backend and returns smart optimization advice.
 """
 
+import functools
+import json
 import logging
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from rich.console import Console
 
+from .ai_cache import get_cached_advice, make_cache_key, store_advice
+
 logger = logging.getLogger(__name__)
 _console = Console(stderr=True)
 
@@ -20,6 +24,49 @@ SYSTEM_PROMPT = (
     "Keep your response under 300 words. Use bullet points."
 )
 
+# Early-stop budget for streamed advice (SYSTEM_PROMPT asks for <300 words)
+_MAX_ADVICE_WORDS = 280
+_STOP_MARKER = "\n5."
+
+BATCH_SYSTEM_PROMPT = (
+    "You are a senior database performance engineer. "
+    "You will receive several SQL queries, each with its execution plan. "
+    "For EACH query, provide concise, actionable performance improvement "
+    "suggestions focused on indexing, query rewriting, and configuration "
+    "tuning. Keep each answer under 200 words. "
+    'Respond with a JSON object of the form {"advice": ["...", "..."]} '
+    "where the array has exactly one entry per query, in the same order."
+)
+
+
+# Client constructors are memoized: each SDK client owns an HTTP
+# connection pool, so rebuilding one per call means a fresh DNS lookup
+# and TLS handshake per query. Reusing the instance keeps the
+# connection alive across calls.
+
+@functools.lru_cache(maxsize=4)
+def _openai_client(api_key: str):
+    """Return a cached OpenAI client for the given API key."""
+    from openai import OpenAI
+
+    return OpenAI(api_key=api_key)
+
+
+@functools.lru_cache(maxsize=4)
+def _groq_client(api_key: str):
+    """Return a cached Groq client for the given API key."""
+    from groq import Groq
+
+    return Groq(api_key=api_key)
+
+
+@functools.lru_cache(maxsize=4)
+def _ollama_client(host: str):
+    """Return a cached Ollama client for the given host."""
+    import ollama as ollama_lib
+
+    return ollama_lib.Client(host=host)
+
 
 def get_ai_suggestions(
     query: str,
@@ -42,6 +89,12 @@ def get_ai_suggestions(
         logger.warning("OpenAI API key not configured. Skipping AI analysis.")
         return None
 
+    # Return cached advice for repeated (query, plan) pairs
+    cache_key = make_cache_key(model, query, explain_output)
+    cached = get_cached_advice(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         from openai import OpenAI
     except ImportError:
@@ -51,7 +104,7 @@ def get_ai_suggestions(
     prompt = _build_prompt(query, explain_output)
 
     try:
-        client = OpenAI(api_key=api_key)
+        client = _openai_client(api_key)
         response = client.chat.completions.create(
             model=model,
             messages=[
@@ -59,11 +112,18 @@ def get_ai_suggestions(
                 {"role": "user", "content": prompt},
             ],
             temperature=0.3,
-            max_tokens=500,
+            max_tokens=300,
+            stream=True,
         )
 
-        advice = response.choices[0].message.content
+        advice = _collect_stream(
+            chunk.choices[0].delta.content
+            for chunk in response
+            if chunk.choices
+        )
         logger.info("Received AI optimization advice.")
+        if advice:
+            store_advice(cache_key, advice)
         return advice
 
     except Exception as e:
@@ -90,6 +150,12 @@ def get_ollama_suggestions(
     Returns:
         AI-generated optimization suggestions, or None on failure.
     """
+    # Return cached advice for repeated (query, plan) pairs
+    cache_key = make_cache_key(model, query, explain_output)
+    cached = get_cached_advice(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         import ollama as ollama_lib
     except ImportError:
@@ -101,7 +167,7 @@ def get_ollama_suggestions(
     prompt = _build_prompt(query, explain_output)
 
     try:
-        client = ollama_lib.Client(host=host)
+        client = _ollama_client(host)
         _console.print(
             f"[dim]Querying Ollama ({model}) for AI suggestions…[/dim]",
         )
@@ -112,10 +178,13 @@ def get_ollama_suggestions(
                 {"role": "user", "content": prompt},
             ],
             options={"temperature": 0.3},
+            stream=True,
         )
 
-        advice = response.message.content
+        advice = _collect_stream(part.message.content for part in response)
         logger.info("Received Ollama AI optimization advice.")
+        if advice:
+            store_advice(cache_key, advice)
         return advice
 
     except Exception as e:
@@ -149,6 +218,12 @@ def get_groq_suggestions(
         logger.warning("Groq API key not configured. Skipping AI analysis.")
         return None
 
+    # Return cached advice for repeated (query, plan) pairs
+    cache_key = make_cache_key(model, query, explain_output)
+    cached = get_cached_advice(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         from groq import Groq
     except ImportError:
@@ -158,7 +233,7 @@ def get_groq_suggestions(
     prompt = _build_prompt(query, explain_output)
 
     try:
-        client = Groq(api_key=api_key)
+        client = _groq_client(api_key)
         response = client.chat.completions.create(
             model=model,
             messages=[
@@ -166,11 +241,18 @@ def get_groq_suggestions(
                 {"role": "user", "content": prompt},
             ],
             temperature=0.3,
-            max_tokens=500,
+            max_tokens=300,
+            stream=True,
         )
 
-        advice = response.choices[0].message.content
+        advice = _collect_stream(
+            chunk.choices[0].delta.content
+            for chunk in response
+            if chunk.choices
+        )
         logger.info("Received Groq AI optimization advice.")
+        if advice:
+            store_advice(cache_key, advice)
         return advice
 
     except Exception as e:
@@ -178,41 +260,302 @@ def get_groq_suggestions(
         return None
 
 
-def _build_prompt(query: str, explain_output: Optional[str]) -> str:
-    """Build the prompt for the OpenAI API.
+def _collect_stream(token_iter) -> Optional[str]:
+    """Accumulate streamed tokens, bailing out once the budget is spent.
+
+    Stops reading the stream early when a fifth numbered section starts
+    (the prompt asks for four) or the word count passes the advice
+    budget, so we never pay for trailing tokens we would discard anyway.
 
     Args:
-        query: SQL query text.
-        explain_output: EXPLAIN output.
+        token_iter: Iterable of token strings (None entries are skipped).
+
+    Returns:
+        The collected advice text, or None if the stream was empty.
+    """
+    parts: List[str] = []
+    words = 0
+
+    for token in token_iter:
+        if not token:
+            continue
+        parts.append(token)
+        if _STOP_MARKER in token:
+            break
+        words += token.count(" ")
+        if words > _MAX_ADVICE_WORDS:
+            break
+
+    text = "".join(parts)
+    stop = text.find(_STOP_MARKER)
+    if stop != -1:
+        text = text[:stop]
+
+    return text.strip() or None
+
+
+def get_ai_suggestions_batch(
+    pairs: List[Tuple[str, Optional[str]]],
+    api_key: str,
+    model: str = "gpt-4o",
+) -> List[Optional[str]]:
+    """Get OpenAI advice for several (query, explain) pairs in one request.
+
+    Collapses N sequential round-trips into a single chat call that
+    returns a JSON array with one advice entry per query. Cached pairs
+    are served locally and excluded from the request.
+
+    Args:
+        pairs: List of (query_text, explain_output) tuples.
+        api_key: OpenAI API key.
+        model: OpenAI model to use (default: gpt-4o).
+
+    Returns:
+        List of advice strings aligned with pairs (None where unavailable).
+    """
+    if not api_key:
+        logger.warning("OpenAI API key not configured. Skipping AI analysis.")
+        return [None] * len(pairs)
+
+    try:
+        from openai import OpenAI
+    except ImportError:
+        logger.error("openai package not installed. Install with: pip install openai")
+        return [None] * len(pairs)
+
+    def _call(prompt: str) -> Optional[str]:
+        client = _openai_client(api_key)
+        response = client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": BATCH_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            temperature=0.3,
+            response_format={"type": "json_object"},
+        )
+        return response.choices[0].message.content
+
+    return _run_batch(pairs, model, _call, provider="OpenAI")
+
+
+def get_groq_suggestions_batch(
+    pairs: List[Tuple[str, Optional[str]]],
+    api_key: str,
+    model: str = "llama-3.3-70b-versatile",
+) -> List[Optional[str]]:
+    """Get Groq advice for several (query, explain) pairs in one request.
+
+    Collapses N sequential round-trips into a single chat call that
+    returns a JSON array with one advice entry per query. Cached pairs
+    are served locally and excluded from the request.
+
+    Args:
+        pairs: List of (query_text, explain_output) tuples.
+        api_key: Groq API key.
+        model: Groq model name (default: llama-3.3-70b-versatile).
+
+    Returns:
+        List of advice strings aligned with pairs (None where unavailable).
+    """
+    if not api_key:
+        logger.warning("Groq API key not configured. Skipping AI analysis.")
+        return [None] * len(pairs)
+
+    try:
+        from groq import Groq
+    except ImportError:
+        logger.error("groq package not installed. Install with: pip install groq")
+        return [None] * len(pairs)
+
+    def _call(prompt: str) -> Optional[str]:
+        client = _groq_client(api_key)
+        response = client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": BATCH_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            temperature=0.3,
+            response_format={"type": "json_object"},
+        )
+        return response.choices[0].message.content
+
+    return _run_batch(pairs, model, _call, provider="Groq")
+
+
+def _run_batch(
+    pairs: List[Tuple[str, Optional[str]]],
+    model: str,
+    call_fn,
+    provider: str = "AI",
+) -> List[Optional[str]]:
+    """Shared batch driver: serve cache hits, send misses in one call.
+
+    Args:
+        pairs: List of (query_text, explain_output) tuples.
+        model: Model name (for cache keying).
+        call_fn: Callable taking the batch prompt, returning raw JSON text.
+        provider: Provider name for log messages.
+
+    Returns:
+        List of advice strings aligned with pairs (None where unavailable).
+    """
+    advice: List[Optional[str]] = [None] * len(pairs)
+    cache_keys: List[str] = []
+    miss_indices: List[int] = []
+
+    for idx, (query, explain_output) in enumerate(pairs):
+        key = make_cache_key(model, query, explain_output)
+        cache_keys.append(key)
+        cached = get_cached_advice(key)
+        if cached is not None:
+            advice[idx] = cached
+        else:
+            miss_indices.append(idx)
+
+    if not miss_indices:
+        return advice
+
+    prompt = _build_batch_prompt([pairs[i] for i in miss_indices])
+
+    try:
+        content = call_fn(prompt)
+    except Exception as e:
+        logger.error("%s batch API call failed: %s", provider, e)
+        return advice
+
+    parsed = _parse_batch_response(content, expected=len(miss_indices))
+    for idx, item in zip(miss_indices, parsed):
+        if item:
+            advice[idx] = item
+            store_advice(cache_keys[idx], item)
+
+    logger.info(
+        "Received %s batch advice for %d queries (%d from cache).",
+        provider,
+        len(miss_indices),
+        len(pairs) - len(miss_indices),
+    )
+    return advice
+
+
+def _build_batch_prompt(pairs: List[Tuple[str, Optional[str]]]) -> str:
+    """Build a single prompt covering multiple (query, plan) pairs.
+
+    Args:
+        pairs: List of (query_text, explain_output) tuples.
 
     Returns:
         Formatted prompt string.
     """
     parts = [
-        "Analyze the following SQL query and its execution plan for performance issues.",
-        "",
-        "## SQL Query",
-        "```sql",
-        query,
-        "```",
+        f"Analyze the following {len(pairs)} SQL queries for performance issues. "
+        'Return a JSON object {"advice": [...]} with one advice string per '
+        "query, in order.",
     ]
 
-    if explain_output:
+    for idx, (query, explain_output) in enumerate(pairs, start=1):
         parts.extend([
             "",
-            "## Execution Plan (EXPLAIN output)",
-            "```",
-            explain_output[:3000],  # Limit size to avoid token overflow
+            f"## Query {idx}",
+            "```sql",
+            query,
             "```",
         ])
-
-    parts.extend([
-        "",
-        "## Please provide:",
-        "1. Key performance issues identified",
-        "2. Specific index recommendations",
-        "3. Query rewrite suggestions (if applicable)",
-        "4. Database configuration recommendations (if applicable)",
-    ])
+        if explain_output:
+            parts.extend([
+                f"### Execution Plan {idx}",
+                "```",
+                explain_output[:3000],  # Limit size to avoid token overflow
+                "```",
+            ])
 
     return "\n".join(parts)
+
+
+def _parse_batch_response(
+    content: Optional[str],
+    expected: int,
+) -> List[Optional[str]]:
+    """Parse the JSON-array batch response into per-query advice.
+
+    Args:
+        content: Raw response text (expected JSON object with "advice").
+        expected: Number of queries in the batch.
+
+    Returns:
+        List of length ``expected`` (padded with None on malformed output).
+    """
+    result: List[Optional[str]] = [None] * expected
+
+    if not content:
+        return result
+
+    try:
+        data = json.loads(content)
+    except (json.JSONDecodeError, TypeError) as e:
+        logger.warning("Could not parse batch AI response as JSON: %s", e)
+        return result
+
+    items = data.get("advice") if isinstance(data, dict) else data
+    if not isinstance(items, list):
+        logger.warning("Batch AI response missing 'advice' array.")
+        return result
+
+    for idx, item in enumerate(items[:expected]):
+        if isinstance(item, str) and item.strip():
+            result[idx] = item.strip()
+
+    return result
+
+
+# Pre-rendered prompt templates — built once at import instead of
+# reassembling the same dozen lines and joining them per LLM call.
+_PROMPT_ASK = """
+## Please provide:
+1. Key performance issues identified
+2. Specific index recommendations
+3. Query rewrite suggestions (if applicable)
+4. Database configuration recommendations (if applicable)"""
+
+_PROMPT_WITH_PLAN = (
+    "Analyze the following SQL query and its execution plan for performance issues.\n"
+    "\n"
+    "## SQL Query\n"
+    "```sql\n"
+    "{query}\n"
+    "```\n"
+    "\n"
+    "## Execution Plan (EXPLAIN output)\n"
+    "```\n"
+    "{explain}\n"
+    "```\n" + _PROMPT_ASK
+)
+
+_PROMPT_NO_PLAN = (
+    "Analyze the following SQL query and its execution plan for performance issues.\n"
+    "\n"
+    "## SQL Query\n"
+    "```sql\n"
+    "{query}\n"
+    "```\n" + _PROMPT_ASK
+)
+
+
+def _build_prompt(query: str, explain_output: Optional[str]) -> str:
+    """Build the prompt for the OpenAI API.
+
+    Args:
+        query: SQL query text.
+        explain_output: EXPLAIN output.
+
+    Returns:
+        Formatted prompt string.
+    """
+    if explain_output:
+        return _PROMPT_WITH_PLAN.format(
+            query=query,
+            explain=explain_output[:3000],  # Limit size to avoid token overflow
+        )
+    return _PROMPT_NO_PLAN.format(query=query)
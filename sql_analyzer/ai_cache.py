@@ -0,0 +1,138 @@
+"""Persistent cache for AI advisor results.
+
+Stores optimization advice in a small SQLite database keyed on
+``sha256(model|query|explain_output)`` so repeated or templated queries
+skip the LLM round-trip entirely on subsequent lookups — both within a
+run and across runs.
+
+The cache file lives in the project root (``.ai_cache.db``) alongside
+``.credentials`` and is created lazily on first use.
+"""
+
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Default location for the cache database
+CACHE_FILE = Path(".ai_cache.db")
+
+# Keep key computation aligned with _build_prompt's plan truncation
+_EXPLAIN_KEY_LIMIT = 3000
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_connection: Optional[sqlite3.Connection] = None
+
+# The AI advisors call into the cache from ThreadPoolExecutor workers,
+# so the shared connection is opened with check_same_thread=False and
+# every use (including the lazy open) is serialized through this lock —
+# a sqlite3 connection is not safe for concurrent statements.
+_lock = threading.Lock()
+
+
+def _get_connection(path: Path = CACHE_FILE) -> sqlite3.Connection:
+    """Open (once) and return the cache database connection.
+
+    Must be called with ``_lock`` held.
+
+    Args:
+        path: Path to the SQLite cache file.
+
+    Returns:
+        An open sqlite3 connection with the cache table created.
+    """
+    global _connection
+    if _connection is None:
+        _connection = sqlite3.connect(str(path), check_same_thread=False)
+        _connection.execute(
+            "CREATE TABLE IF NOT EXISTS ai_cache ("
+            "key TEXT PRIMARY KEY, advice TEXT, ts INTEGER)"
+        )
+        _connection.commit()
+        logger.debug("AI cache opened at %s", path)
+    return _connection
+
+
+def make_cache_key(model: str, query: str, explain_output: Optional[str]) -> str:
+    """Build a stable cache key for a (model, query, plan) triple.
+
+    Query whitespace is collapsed so reformatted duplicates hash the
+    same; the plan is truncated to the same limit used when building
+    the LLM prompt.
+
+    Args:
+        model: Model name the advice was generated with.
+        query: SQL query text.
+        explain_output: EXPLAIN plan output (may be None).
+
+    Returns:
+        Hex-encoded SHA-256 digest.
+    """
+    normalized_query = _WHITESPACE_RE.sub(" ", query).strip()
+    plan = (explain_output or "")[:_EXPLAIN_KEY_LIMIT]
+    raw = f"{model}|{normalized_query}|{plan}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def get_cached_advice(key: str) -> Optional[str]:
+    """Look up previously stored advice.
+
+    Args:
+        key: Cache key from make_cache_key().
+
+    Returns:
+        The cached advice string, or None on a miss or cache error.
+    """
+    try:
+        with _lock:
+            conn = _get_connection()
+            row = conn.execute(
+                "SELECT advice FROM ai_cache WHERE key = ?", (key,)
+            ).fetchone()
+    except sqlite3.Error as e:
+        logger.warning("AI cache lookup failed: %s", e)
+        return None
+
+    if row is not None:
+        logger.info("AI cache hit for key %s…", key[:12])
+        return row[0]
+    return None
+
+
+def store_advice(key: str, advice: str) -> None:
+    """Persist advice for a cache key.
+
+    Args:
+        key: Cache key from make_cache_key().
+        advice: AI-generated advice text.
+    """
+    try:
+        with _lock:
+            conn = _get_connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO ai_cache (key, advice, ts) VALUES (?, ?, ?)",
+                (key, advice, int(time.time())),
+            )
+            conn.commit()
+    except sqlite3.Error as e:
+        logger.warning("AI cache store failed: %s", e)
+
+
+def close_cache() -> None:
+    """Close the cache connection if open."""
+    global _connection
+    with _lock:
+        if _connection is not None:
+            try:
+                _connection.close()
+            except sqlite3.Error as e:
+                logger.error("Error closing AI cache: %s", e)
+            finally:
+                _connection = None
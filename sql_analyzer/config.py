@@ -1,16 +1,28 @@
 """Configuration management for SQL Analyzer."""
 
+import functools
 import os
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Optional
 
-from dotenv import load_dotenv
+logger = logging.getLogger(__name__)
 
-# Load .env file if present
-load_dotenv()
+_dotenv_loaded = False
 
-logger = logging.getLogger(__name__)
+
+def _load_dotenv_once() -> None:
+    """Load the .env file on first config read instead of at import.
+
+    Scanning cwd and parents for .env and parsing it is filesystem work
+    we only need once per process.
+    """
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _dotenv_loaded = True
 
 
 @dataclass
@@ -28,6 +40,7 @@ class DatabaseConfig:
     pg_database: str = "postgres"
     pg_user: str = "postgres"
     pg_password: str = ""
+    pg_pool_size: int = 4  # Max connections in the shared psycopg2 pool
 
     # SQL Server settings
     mssql_driver: str = "{ODBC Driver 18 for SQL Server}"
@@ -39,26 +52,38 @@ class DatabaseConfig:
 
     @classmethod
     def from_env(cls, db_type: str = "postgres") -> "DatabaseConfig":
-        """Create config from environment variables."""
-        return cls(
-            db_type=db_type,
-            # SQLite
-            sqlite_path=os.getenv("SQLITE_PATH", "database.db"),
-            # PostgreSQL
-            pg_host=os.getenv("PG_HOST", "localhost"),
-            pg_port=int(os.getenv("PG_PORT", "5432")),
-            pg_database=os.getenv("PG_DATABASE", "postgres"),
-            pg_user=os.getenv("PG_USER", "postgres"),
-            pg_password=os.getenv("PG_PASSWORD", ""),
-            # SQL Server
-            mssql_driver=os.getenv("MSSQL_DRIVER", "{ODBC Driver 18 for SQL Server}"),
-            mssql_server=os.getenv("MSSQL_SERVER", "localhost"),
-            mssql_database=os.getenv("MSSQL_DATABASE", "master"),
-            mssql_user=os.getenv("MSSQL_USER", "sa"),
-            mssql_password=os.getenv("MSSQL_PASSWORD", ""),
-            mssql_trusted_connection=os.getenv("MSSQL_TRUSTED", "false").lower()
-            == "true",
-        )
+        """Create config from environment variables.
+
+        The environment snapshot is cached per db_type; each call
+        returns a fresh copy so callers can mutate it safely.
+        """
+        return replace(_database_config_from_env(db_type))
+
+
+@functools.lru_cache(maxsize=4)
+def _database_config_from_env(db_type: str) -> "DatabaseConfig":
+    """Build a DatabaseConfig from the environment (cached)."""
+    _load_dotenv_once()
+    return DatabaseConfig(
+        db_type=db_type,
+        # SQLite
+        sqlite_path=os.getenv("SQLITE_PATH", "database.db"),
+        # PostgreSQL
+        pg_host=os.getenv("PG_HOST", "localhost"),
+        pg_port=int(os.getenv("PG_PORT", "5432")),
+        pg_database=os.getenv("PG_DATABASE", "postgres"),
+        pg_user=os.getenv("PG_USER", "postgres"),
+        pg_password=os.getenv("PG_PASSWORD", ""),
+        pg_pool_size=int(os.getenv("PG_POOL_SIZE", "4")),
+        # SQL Server
+        mssql_driver=os.getenv("MSSQL_DRIVER", "{ODBC Driver 18 for SQL Server}"),
+        mssql_server=os.getenv("MSSQL_SERVER", "localhost"),
+        mssql_database=os.getenv("MSSQL_DATABASE", "master"),
+        mssql_user=os.getenv("MSSQL_USER", "sa"),
+        mssql_password=os.getenv("MSSQL_PASSWORD", ""),
+        mssql_trusted_connection=os.getenv("MSSQL_TRUSTED", "false").lower()
+        == "true",
+    )
 
 
 @dataclass
@@ -70,6 +95,11 @@ class AnalyzerConfig:
     slow_query_threshold_ms: float = 500.0  # Threshold to mark as SLOW QUERY
     interest_threshold_ms: float = 300.0  # Only consider queries above this for detail/AI
     continue_on_error: bool = True  # Continue executing after a query fails
+    max_workers: int = 4  # Worker threads for I/O-bound post-processing
+    batch_identical: bool = False  # Dispatch identical DML runs in one round trip
+    commit_every: int = 1  # Commit once per N mutating statements
+    force_ai: bool = False  # Analyze every SELECT regardless of interest threshold
+    force_refresh: bool = False  # Ignore the cached report for unchanged inputs
 
     # Output settings
     save_json: bool = False
@@ -78,6 +108,7 @@ class AnalyzerConfig:
     csv_output_path: str = "performance_report.csv"
     colored_output: bool = True
     batch_mode: bool = False  # Print full results without interactive prompt
+    summary_only: bool = False  # Skip per-query panels for clean fast queries
 
     # AI backend: "openai", "ollama", or "groq"
     ai_backend: str = "openai"
@@ -103,27 +134,49 @@ class AnalyzerConfig:
 
     @classmethod
     def from_env(cls) -> "AnalyzerConfig":
-        """Create config from environment variables."""
-        return cls(
-            explain_analyze=os.getenv("EXPLAIN_ANALYZE", "false").lower() == "true",
-            slow_query_threshold_ms=float(
-                os.getenv("SLOW_QUERY_THRESHOLD_MS", "500")
-            ),
-            interest_threshold_ms=float(
-                os.getenv("INTEREST_THRESHOLD_MS", "300")
-            ),
-            ai_backend=os.getenv("AI_BACKEND", "openai"),
-            openai_enabled=os.getenv("OPENAI_ENABLED", "false").lower() == "true",
-            openai_api_key=os.getenv("OPENAI_API_KEY", ""),
-            openai_model=os.getenv("OPENAI_MODEL", "gpt-4o"),
-            ollama_enabled=os.getenv("OLLAMA_ENABLED", "false").lower() == "true",
-            ollama_model=os.getenv("OLLAMA_MODEL", "llama3"),
-            ollama_host=os.getenv("OLLAMA_HOST", "http://localhost:11434"),
-            groq_enabled=os.getenv("GROQ_ENABLED", "false").lower() == "true",
-            groq_api_key=os.getenv("GROQ_API_KEY", ""),
-            groq_model=os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile"),
-            colored_output=os.getenv("COLORED_OUTPUT", "true").lower() == "true",
-        )
+        """Create config from environment variables.
+
+        The environment snapshot is cached; each call returns a fresh
+        copy so callers can mutate it safely.
+        """
+        return replace(_analyzer_config_from_env())
+
+
+@functools.lru_cache(maxsize=1)
+def _analyzer_config_from_env() -> "AnalyzerConfig":
+    """Build an AnalyzerConfig from the environment (cached)."""
+    _load_dotenv_once()
+    return AnalyzerConfig(
+        explain_analyze=os.getenv("EXPLAIN_ANALYZE", "false").lower() == "true",
+        slow_query_threshold_ms=float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "500")),
+        interest_threshold_ms=float(os.getenv("INTEREST_THRESHOLD_MS", "300")),
+        max_workers=int(os.getenv("MAX_WORKERS", "4")),
+        batch_identical=os.getenv("BATCH_IDENTICAL", "false").lower() == "true",
+        commit_every=int(os.getenv("COMMIT_EVERY", "1")),
+        ai_backend=os.getenv("AI_BACKEND", "openai"),
+        openai_enabled=os.getenv("OPENAI_ENABLED", "false").lower() == "true",
+        openai_api_key=os.getenv("OPENAI_API_KEY", ""),
+        openai_model=os.getenv("OPENAI_MODEL", "gpt-4o"),
+        ollama_enabled=os.getenv("OLLAMA_ENABLED", "false").lower() == "true",
+        ollama_model=os.getenv("OLLAMA_MODEL", "llama3"),
+        ollama_host=os.getenv("OLLAMA_HOST", "http://localhost:11434"),
+        groq_enabled=os.getenv("GROQ_ENABLED", "false").lower() == "true",
+        groq_api_key=os.getenv("GROQ_API_KEY", ""),
+        groq_model=os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile"),
+        colored_output=os.getenv("COLORED_OUTPUT", "true").lower() == "true",
+    )
+
+
+def reload_configs() -> None:
+    """Drop cached env snapshots and re-read .env on next access.
+
+    Intended for tests and long-lived processes that change the
+    environment at runtime.
+    """
+    global _dotenv_loaded
+    _database_config_from_env.cache_clear()
+    _analyzer_config_from_env.cache_clear()
+    _dotenv_loaded = False
 
 
 def setup_logging(config: AnalyzerConfig) -> None:
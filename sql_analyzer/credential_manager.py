@@ -16,10 +16,12 @@ Typical flow
 """
 
 import base64
+import functools
 import getpass
 import hashlib
 import json
 import logging
+import os
 import platform
 import uuid
 from pathlib import Path
@@ -27,6 +29,12 @@ from typing import Optional
 
 from rich.console import Console
 
+# Optional fast JSON backend (Rust); stdlib json is the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 _console = Console(stderr=True)
 
@@ -34,6 +42,7 @@ _console = Console(stderr=True)
 CREDENTIALS_FILE = Path(".credentials")
 
 
+@functools.lru_cache(maxsize=1)
 def _derive_machine_key() -> bytes:
     """Derive a deterministic Fernet key from machine-specific attributes.
 
@@ -41,6 +50,9 @@ def _derive_machine_key() -> bytes:
     reproducible 32-byte key (URL-safe base64-encoded) that stays the
     same across runs on this machine but differs between machines.
 
+    Cached: ``uuid.getnode()`` can scan network interfaces on some
+    platforms, so it should only run once per process.
+
     Returns:
         A 32-byte URL-safe base64-encoded Fernet key.
     """
@@ -49,11 +61,28 @@ def _derive_machine_key() -> bytes:
     return base64.urlsafe_b64encode(digest)
 
 
+@functools.lru_cache(maxsize=1)
 def _get_fernet():
-    """Return a Fernet instance using the machine-derived key."""
-    from cryptography.fernet import Fernet
+    """Return the shared Fernet instance using the machine-derived key.
+
+    Prefers the Rust-backed ``rfernet`` implementation when installed —
+    it produces/accepts the same token format but avoids the per-call
+    allocation overhead of the ``cryptography`` Python layer — and
+    falls back to ``cryptography.fernet`` otherwise. Either way the
+    AES-128-CBC+HMAC cipher runs on hardware AES-NI where available.
+
+    Cached so repeated save/load operations skip Fernet construction
+    (and its AES key schedule), not just the key derivation.
+    """
+    key = _derive_machine_key()
+    try:
+        from rfernet import Fernet
+
+        return Fernet(key.decode())
+    except ImportError:
+        from cryptography.fernet import Fernet
 
-    return Fernet(_derive_machine_key())
+        return Fernet(key)
 
 
 def encrypt_value(plain_text: str) -> str:
@@ -65,8 +94,9 @@ def encrypt_value(plain_text: str) -> str:
     Returns:
         Encrypted token as a string.
     """
-    fernet = _get_fernet()
-    return fernet.encrypt(plain_text.encode()).decode()
+    token = _get_fernet().encrypt(plain_text.encode())
+    # rfernet returns str, cryptography returns bytes
+    return token.decode() if isinstance(token, bytes) else token
 
 
 def decrypt_value(token: str) -> str:
@@ -82,8 +112,87 @@ def decrypt_value(token: str) -> str:
         cryptography.fernet.InvalidToken: If the token is invalid or
         was encrypted on a different machine.
     """
-    fernet = _get_fernet()
-    return fernet.decrypt(token.encode()).decode()
+    plain = _get_fernet().decrypt(token.encode())
+    return plain.decode() if isinstance(plain, bytes) else plain
+
+
+def _read_credentials(path: Path) -> dict:
+    """Read and parse the credentials file in one buffered read.
+
+    Args:
+        path: Path to the credentials JSON file.
+
+    Returns:
+        Parsed credential dict, or an empty dict if the file is missing
+        or unreadable.
+    """
+    try:
+        with path.open("rb") as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (json.JSONDecodeError, ValueError, OSError):
+        return {}
+
+
+def _write_credentials(path: Path, data: dict) -> None:
+    """Write the credential dict atomically.
+
+    Serializes once, writes to a sibling temp file in a single
+    ``write()``, then renames over the target with ``os.replace`` so a
+    concurrent CLI invocation (or a crash mid-write) never observes a
+    truncated file.
+
+    Args:
+        path: Path to the credentials JSON file.
+        data: Credential dict to persist.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode("utf-8")
+    with tmp.open("wb") as f:
+        f.write(payload)
+    os.replace(tmp, path)
+
+
+class CredentialStore:
+    """Context manager that batches credential writes into one flush.
+
+    Loads the credentials file once on entry, buffers ``set`` calls in
+    memory, and performs a single atomic write on exit — so saving N
+    credentials costs one read and one write instead of N of each.
+
+    Example:
+        with CredentialStore() as store:
+            store.set("pg_password", pg_pw)
+            store.set("mssql_password", mssql_pw)
+    """
+
+    def __init__(self, path: Path = CREDENTIALS_FILE):
+        self.path = path
+        self._data: dict = {}
+        self._dirty = False
+
+    def __enter__(self) -> "CredentialStore":
+        self._data = _read_credentials(self.path)
+        self._dirty = False
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        # Don't persist a half-finished batch if the block raised.
+        if self._dirty and exc_type is None:
+            _write_credentials(self.path, self._data)
+
+    def set(self, key: str, plain_text: str) -> None:
+        """Encrypt and stage a credential for the flush on exit.
+
+        Args:
+            key: Identifier for the credential (e.g. ``pg_password``).
+            plain_text: The secret value.
+        """
+        self._data[key] = encrypt_value(plain_text)
+        self._dirty = True
 
 
 def save_credential(key: str, plain_text: str, path: Path = CREDENTIALS_FILE) -> None:
@@ -96,15 +205,8 @@ def save_credential(key: str, plain_text: str, path: Path = CREDENTIALS_FILE) ->
         plain_text: The secret value.
         path: Path to the credentials JSON file.
     """
-    data: dict = {}
-    if path.exists():
-        try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
-            data = {}
-
-    data[key] = encrypt_value(plain_text)
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    with CredentialStore(path) as store:
+        store.set(key, plain_text)
     logger.info("Credential '%s' saved to %s", key, path)
 
 
@@ -122,12 +224,7 @@ def load_credential(key: str, path: Path = CREDENTIALS_FILE) -> Optional[str]:
     if not path.exists():
         return None
 
-    try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
-        return None
-
-    token = data.get(key)
+    token = _read_credentials(path).get(key)
     if not token:
         return None
 
@@ -5,25 +5,102 @@ with proper transaction handling and connection lifecycle management.
 """
 
 import logging
+import queue
+import sqlite3
 from contextlib import contextmanager
-from typing import Generator, Optional
+from typing import Generator, List, Optional
 
 from .config import DatabaseConfig
 
+# Optional drivers resolved once at import; the connect methods check
+# for None so reconnect-heavy callers skip the per-call import lock.
+try:
+    import psycopg2
+    import psycopg2.pool
+except ImportError:
+    psycopg2 = None
+
+try:
+    import pyodbc
+
+    # Let the ODBC driver manager reuse HENV/HDBC handles across
+    # connector instances instead of a fresh handshake each time.
+    pyodbc.pooling = True
+except ImportError:
+    pyodbc = None
+
 logger = logging.getLogger(__name__)
 
+# Shared psycopg2 pool, built lazily on the first PostgreSQL connect.
+# Keyed on the connection parameters so a config change rebuilds it.
+_pg_pool = None
+_pg_pool_key = None
+
+
+def _get_pg_pool(config: DatabaseConfig):
+    """Return the shared ThreadedConnectionPool for ``config``.
+
+    Creates the pool on first use (TCP+TLS+auth paid once for up to
+    ``pg_pool_size`` connections) and replaces it if the connection
+    parameters change.
+    """
+    global _pg_pool, _pg_pool_key
+    key = (
+        config.pg_host,
+        config.pg_port,
+        config.pg_database,
+        config.pg_user,
+        config.pg_password,
+    )
+    if _pg_pool is None or _pg_pool_key != key:
+        if _pg_pool is not None:
+            _pg_pool.closeall()
+        _pg_pool = psycopg2.pool.ThreadedConnectionPool(
+            minconn=1,
+            maxconn=max(1, config.pg_pool_size),
+            host=config.pg_host,
+            port=config.pg_port,
+            dbname=config.pg_database,
+            user=config.pg_user,
+            password=config.pg_password,
+        )
+        _pg_pool_key = key
+        logger.info(
+            "Created PostgreSQL connection pool (maxconn=%d).",
+            max(1, config.pg_pool_size),
+        )
+    return _pg_pool
+
+
+def close_pg_pool() -> None:
+    """Close every connection in the shared PostgreSQL pool."""
+    global _pg_pool, _pg_pool_key
+    if _pg_pool is not None:
+        _pg_pool.closeall()
+        _pg_pool = None
+        _pg_pool_key = None
+        logger.info("PostgreSQL connection pool closed.")
+
 
 class DatabaseConnector:
     """Manages database connections with support for PostgreSQL, SQL Server, and SQLite."""
 
-    def __init__(self, config: DatabaseConfig):
+    def __init__(self, config: DatabaseConfig, read_only: bool = False):
         """Initialize the database connector.
 
         Args:
             config: Database configuration instance.
+            read_only: Open the connection for read-only use. SQLite
+                handles additionally allow cross-thread use so they can
+                live in a pool.
         """
         self.config = config
+        self.read_only = read_only
         self._connection = None
+        self._from_pg_pool = False
+        # Per-connector dispatch cache filled by the executor on the
+        # first EXPLAIN, replacing a db_type branch per SELECT.
+        self._explain_fn = None
 
     def connect(self) -> None:
         """Establish a database connection based on the configured database type.
@@ -43,21 +120,16 @@ class DatabaseConnector:
 
     def _connect_postgres(self) -> None:
         """Connect to PostgreSQL using psycopg2."""
-        try:
-            import psycopg2
-        except ImportError:
+        if psycopg2 is None:
             raise ImportError(
                 "psycopg2 is not installed. Install it with: pip install psycopg2-binary"
             )
 
         try:
-            self._connection = psycopg2.connect(
-                host=self.config.pg_host,
-                port=self.config.pg_port,
-                dbname=self.config.pg_database,
-                user=self.config.pg_user,
-                password=self.config.pg_password,
-            )
+            # Check a connection out of the shared pool rather than
+            # paying the TCP+TLS+auth round trip per connector.
+            self._connection = _get_pg_pool(self.config).getconn()
+            self._from_pg_pool = True
             # Set autocommit to False for transaction management
             self._connection.autocommit = False
             logger.info(
@@ -71,9 +143,7 @@ class DatabaseConnector:
 
     def _connect_sqlserver(self) -> None:
         """Connect to SQL Server using pyodbc."""
-        try:
-            import pyodbc
-        except ImportError:
+        if pyodbc is None:
             raise ImportError(
                 "pyodbc is not installed. Install it with: pip install pyodbc"
             )
@@ -108,14 +178,33 @@ class DatabaseConnector:
 
     def _connect_sqlite(self) -> None:
         """Connect to SQLite database."""
-        import sqlite3
-
         try:
-            self._connection = sqlite3.connect(self.config.sqlite_path)
+            self._connection = sqlite3.connect(
+                self.config.sqlite_path,
+                check_same_thread=not self.read_only,
+            )
             # Enable foreign keys
             self._connection.execute("PRAGMA foreign_keys = ON")
             # Use Row factory for dict-like access
             self._connection.isolation_level = "DEFERRED"
+            if not self.read_only:
+                # WAL avoids the fsync-per-commit of the rollback
+                # journal while synchronous=NORMAL keeps commits
+                # crash-safe; mode persists in the database file.
+                self._connection.executescript(
+                    "PRAGMA journal_mode=WAL;"
+                    "PRAGMA synchronous=NORMAL;"
+                )
+            # Bigger page cache + in-memory temp structures + mmap'd
+            # reads benefit both writer and pooled read-only handles.
+            self._connection.executescript(
+                "PRAGMA cache_size=-65536;"
+                "PRAGMA temp_store=MEMORY;"
+                "PRAGMA mmap_size=268435456;"
+            )
+            if self.read_only:
+                # Pooled handles only run EXPLAIN/SELECT — enforce it
+                self._connection.execute("PRAGMA query_only = 1")
             logger.info("Connected to SQLite: %s", self.config.sqlite_path)
         except Exception as e:
             raise ConnectionError(f"Failed to connect to SQLite: {e}") from e
@@ -150,15 +239,24 @@ class DatabaseConnector:
             logger.error("Rollback failed: %s", e)
 
     def close(self) -> None:
-        """Close the database connection."""
+        """Close the database connection.
+
+        Pooled PostgreSQL connections are returned to the shared pool
+        for reuse instead of being torn down.
+        """
         if self._connection is not None:
             try:
-                self._connection.close()
-                logger.info("Database connection closed.")
+                if self._from_pg_pool and _pg_pool is not None:
+                    _pg_pool.putconn(self._connection)
+                    logger.debug("Connection returned to PostgreSQL pool.")
+                else:
+                    self._connection.close()
+                    logger.info("Database connection closed.")
             except Exception as e:
                 logger.error("Error closing connection: %s", e)
             finally:
                 self._connection = None
+                self._from_pg_pool = False
 
     @contextmanager
     def cursor(self) -> Generator:
@@ -198,3 +296,75 @@ class DatabaseConnector:
         """Exit context manager and close connection."""
         self.close()
         return False
+
+
+class ConnectionPool:
+    """Fixed-size pool of read-only connections for concurrent dispatch.
+
+    The single writer connection owned by the caller stays in charge of
+    DML/DDL; pooled connections serve EXPLAIN and other read-only work
+    so multiple round-trips can be in flight at once. Connections are
+    handed out via a queue and returned on release (QueuePool pattern).
+    """
+
+    def __init__(self, config: DatabaseConfig, size: int = 4):
+        """Initialize the pool.
+
+        Args:
+            config: Database configuration used for every connection.
+            size: Number of connections to hold.
+        """
+        self.config = config
+        self.size = max(1, size)
+        self._pool: "queue.Queue[DatabaseConnector]" = queue.Queue()
+        self._connectors: List[DatabaseConnector] = []
+
+    def open(self) -> None:
+        """Open all pooled connections.
+
+        Raises:
+            ImportError: If the required database driver is not installed.
+            ConnectionError: If any connection fails.
+        """
+        try:
+            for _ in range(self.size):
+                connector = DatabaseConnector(self.config, read_only=True)
+                connector.connect()
+                self._connectors.append(connector)
+                self._pool.put(connector)
+        except Exception:
+            # Don't leak the connections that did open: callers treat a
+            # failed open() as "no pool" and fall back to the writer.
+            self.close()
+            raise
+        logger.info("Opened connection pool (size=%d).", self.size)
+
+    @contextmanager
+    def acquire(self) -> Generator[DatabaseConnector, None, None]:
+        """Check a connection out of the pool, returning it on exit.
+
+        Yields:
+            A connected read-only DatabaseConnector.
+        """
+        connector = self._pool.get()
+        try:
+            yield connector
+        finally:
+            self._pool.put(connector)
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        for connector in self._connectors:
+            connector.close()
+        self._connectors.clear()
+        logger.info("Connection pool closed.")
+
+    def __enter__(self):
+        """Enter context manager."""
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Exit context manager and close all connections."""
+        self.close()
+        return False
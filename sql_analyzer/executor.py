@@ -4,20 +4,74 @@ Executes SQL statements sequentially, measures execution time using
 time.perf_counter(), and captures rows affected.
 """
 
+import io
+import json
 import logging
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
-from .db_connector import DatabaseConnector
+from .db_connector import ConnectionPool, DatabaseConnector
 from .sql_parser import get_query_type
 
+# Optional fast JSON backend (Rust); stdlib json is the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# String and numeric literals, replaced with '?' to compare query shapes.
+_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+# Statement types eligible for identical-shape batching. SELECTs stay
+# individual — they need per-query row counts and EXPLAIN plans.
+_BATCHABLE_TYPES = {"INSERT", "UPDATE", "DELETE"}
+
+# Statement types known to be read-only — these skip the COMMIT round
+# trip. Anything unrecognized (DDL/OTHER/UNKNOWN) still commits, so an
+# unclassified mutating statement can never lose its write.
+_READ_ONLY_TYPES = {"SELECT", "EXPLAIN", "SHOW"}
+
+# Rows fetched per round when counting SELECT results; bounds peak
+# memory to one window instead of the full result set.
+_FETCH_CHUNK = 10_000
 
-@dataclass
+# EXPLAIN/SHOWPLAN statement fragments, built once instead of per call.
+_PG_EXPLAIN_PREFIX = "EXPLAIN (FORMAT JSON, BUFFERS ON) "
+_PG_EXPLAIN_ANALYZE_PREFIX = "EXPLAIN (FORMAT JSON, BUFFERS ON, ANALYZE ON) "
+_MSSQL_SHOWPLAN_ON = "SET SHOWPLAN_TEXT ON"
+_MSSQL_SHOWPLAN_OFF = "SET SHOWPLAN_TEXT OFF"
+
+
+def _item_type(item: tuple) -> str:
+    """Return the query type for a (sql, line[, type]) tuple.
+
+    split_queries classifies statements up front; older two-element
+    tuples fall back to parsing here.
+    """
+    return item[2] if len(item) > 2 else get_query_type(item[0])
+
+
+def _query_shape(query: str) -> str:
+    """Normalize a statement to its shape by masking literals.
+
+    Two INSERTs that differ only in values produce the same shape and
+    can be dispatched in one batch.
+    """
+    return _LITERAL_RE.sub("?", query)
+
+
+@dataclass(slots=True)
 class QueryResult:
-    """Result of a single query execution."""
+    """Result of a single query execution.
+
+    Slotted: large SQL files produce thousands of these, and dropping
+    the per-instance ``__dict__`` roughly halves their memory.
+    """
 
     query_number: int
     query_text: str
@@ -29,10 +83,56 @@ class QueryResult:
     error_message: Optional[str] = None
     explain_output: Optional[str] = None
     explain_data: Optional[List[Dict[str, Any]]] = None
+    rows: Optional[List[tuple]] = None  # Only populated with include_rows=True
     warnings: List[str] = field(default_factory=list)
     suggestions: List[str] = field(default_factory=list)
     performance_score: Optional[int] = None
     is_slow: bool = False
+    # Lazily computed by explain_lines (a cached_property won't work
+    # with slots, so the cache is an explicit field).
+    _explain_lines: Optional[tuple] = field(default=None, repr=False, compare=False)
+    # Cached (ai, non_ai) partition, computed on first access.
+    _suggestion_split: Optional[tuple] = field(default=None, repr=False, compare=False)
+
+    @property
+    def explain_lines(self) -> tuple:
+        """Split lines of explain_output, computed once and cached.
+
+        EXPLAIN output can be multi-KB and several report paths walk
+        it line by line; caching avoids re-splitting per printer.
+        """
+        if self._explain_lines is None:
+            self._explain_lines = (
+                tuple(self.explain_output.splitlines())
+                if self.explain_output
+                else ()
+            )
+        return self._explain_lines
+
+    @property
+    def ai_suggestions(self) -> List[str]:
+        """Suggestions with the "[AI]" prefix, partitioned once and cached."""
+        return self._partition_suggestions()[0]
+
+    @property
+    def non_ai_suggestions(self) -> List[str]:
+        """Suggestions without the "[AI]" prefix, partitioned once and cached."""
+        return self._partition_suggestions()[1]
+
+    def _partition_suggestions(self) -> tuple:
+        """Split suggestions into (ai, non_ai) lists, caching the result.
+
+        The compact, detail, and summary printers all need this split;
+        without the cache each of them re-tests every suggestion's
+        prefix.
+        """
+        if self._suggestion_split is None:
+            ai: List[str] = []
+            non_ai: List[str] = []
+            for s in self.suggestions:
+                (ai if s.startswith("[AI]") else non_ai).append(s)
+            self._suggestion_split = (ai, non_ai)
+        return self._suggestion_split
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert result to a dictionary for serialization."""
@@ -58,6 +158,12 @@ def execute_query(
     query_number: int,
     explain_analyze: bool = False,
     line_number: int = 0,
+    pool: Optional[ConnectionPool] = None,
+    run_explain: bool = True,
+    include_rows: bool = False,
+    defer_commit: bool = False,
+    cursor=None,
+    query_type: Optional[str] = None,
 ) -> QueryResult:
     """Execute a single SQL query and measure its performance.
 
@@ -67,11 +173,27 @@ def execute_query(
         query_number: Sequential number of this query.
         explain_analyze: Whether to run EXPLAIN ANALYZE for SELECT queries.
         line_number: 1-based line number of the query in the original SQL file.
+        pool: Optional read-only connection pool; when provided, EXPLAIN
+            runs on a pooled connection instead of the writer.
+        run_explain: Run EXPLAIN inline; callers that batch EXPLAINs
+            afterwards (execute_all_queries with a pool) pass False.
+        include_rows: Keep the fetched SELECT rows on ``result.rows``.
+            Off by default — the analyzer only needs the count, so rows
+            are counted in fixed-size chunks and discarded.
+        defer_commit: Leave the transaction open after a mutating
+            statement; the caller takes over commit responsibility
+            (used by execute_all_queries with commit_every > 1).
+        cursor: Reuse this open cursor instead of allocating one per
+            statement — execute_all_queries shares a single cursor
+            across its serial pass.
+        query_type: Pre-classified statement type from split_queries;
+            parsed here only when not supplied.
 
     Returns:
         QueryResult with timing, row count, and status.
     """
-    query_type = get_query_type(query)
+    if query_type is None:
+        query_type = get_query_type(query)
     result = QueryResult(
         query_number=query_number,
         query_text=query,
@@ -79,33 +201,29 @@ def execute_query(
         line_number=line_number,
     )
 
+    # EXPLAIN ANALYZE already executes the statement and reports its
+    # timing, so on PostgreSQL a fused round trip replaces the usual
+    # execute-then-explain pair (and plans the query once, not twice).
+    if (
+        query_type == "SELECT"
+        and explain_analyze
+        and connector.db_type == "postgres"
+        and not include_rows
+    ):
+        if _execute_select_via_explain(connector, result, query):
+            return result
+
     # Execute the main query
     try:
-        with connector.cursor() as cur:
-            # Measure execution time with high precision
-            start_time = time.perf_counter()
-            cur.execute(query)
-            end_time = time.perf_counter()
-
-            result.execution_time_ms = (end_time - start_time) * 1000.0
-
-            # Get rows affected
-            if query_type == "SELECT":
-                rows = cur.fetchall()
-                result.rows_affected = len(rows)
-            elif cur.rowcount >= 0:
-                result.rows_affected = cur.rowcount
-
-            # Commit successful query
-            connector.commit()
-
-            logger.info(
-                "Query #%d executed in %.2f ms (%d rows)",
-                query_number,
-                result.execution_time_ms,
-                result.rows_affected,
+        if cursor is not None:
+            _execute_on_cursor(
+                connector, cursor, result, include_rows, defer_commit
             )
-
+        else:
+            with connector.cursor() as cur:
+                _execute_on_cursor(
+                    connector, cur, result, include_rows, defer_commit
+                )
     except Exception as e:
         result.success = False
         result.error_message = str(e)
@@ -113,16 +231,123 @@ def execute_query(
         logger.error("Query #%d failed: %s", query_number, e)
 
     # Run EXPLAIN for SELECT queries (separate execution)
-    if result.success and query_type == "SELECT":
+    if run_explain and result.success and query_type == "SELECT":
         try:
-            explain_output = _run_explain(connector, query, explain_analyze)
-            result.explain_output = explain_output
+            if pool is not None:
+                with pool.acquire() as explain_connector:
+                    result.explain_output = _run_explain(
+                        explain_connector, query, explain_analyze
+                    )
+            else:
+                result.explain_output = _run_explain(connector, query, explain_analyze)
         except Exception as e:
             logger.warning("EXPLAIN failed for query #%d: %s", query_number, e)
 
     return result
 
 
+def _execute_on_cursor(
+    connector: DatabaseConnector,
+    cur,
+    result: QueryResult,
+    include_rows: bool,
+    defer_commit: bool,
+) -> None:
+    """Run ``result.query_text`` on an open cursor and fill in timing.
+
+    Split out of execute_query so callers can reuse one cursor across
+    many statements instead of allocating one each.
+
+    Args:
+        connector: Active database connector (for commit).
+        cur: Open cursor to execute on.
+        result: QueryResult to populate; query text/type are read from it.
+        include_rows: Keep fetched SELECT rows on ``result.rows``.
+        defer_commit: Skip the commit; the caller commits later.
+    """
+    # Measure execution time with high precision
+    start_time = time.perf_counter()
+    cur.execute(result.query_text)
+    end_time = time.perf_counter()
+
+    result.execution_time_ms = (end_time - start_time) * 1000.0
+
+    # Get rows affected
+    if result.query_type == "SELECT":
+        if include_rows:
+            result.rows = cur.fetchall()
+            result.rows_affected = len(result.rows)
+        else:
+            # Count in bounded chunks so a huge result set never
+            # materializes in memory at once.
+            count = 0
+            while True:
+                batch = cur.fetchmany(_FETCH_CHUNK)
+                if not batch:
+                    break
+                count += len(batch)
+            result.rows_affected = count
+    elif cur.rowcount >= 0:
+        result.rows_affected = cur.rowcount
+
+    # Commit successful query; read-only statements have nothing to
+    # commit, so skip the round trip.
+    if result.query_type not in _READ_ONLY_TYPES and not defer_commit:
+        connector.commit()
+
+    logger.debug(
+        "Query #%d executed in %.2f ms (%d rows)",
+        result.query_number,
+        result.execution_time_ms,
+        result.rows_affected,
+    )
+
+
+def _execute_select_via_explain(
+    connector: DatabaseConnector,
+    result: QueryResult,
+    query: str,
+) -> bool:
+    """Run a SELECT through EXPLAIN ANALYZE in one round trip (PostgreSQL).
+
+    Fills ``result`` with the plan output plus the server-reported
+    execution time and actual row count from the plan JSON, falling
+    back to wall-clock time if the JSON is unparseable.
+
+    Args:
+        connector: Active PostgreSQL connector.
+        result: The QueryResult to populate.
+        query: The SELECT statement.
+
+    Returns:
+        True if the fused path succeeded; False to let the caller fall
+        back to the separate execute + explain path.
+    """
+    start_time = time.perf_counter()
+    output = _run_explain_postgres(connector, query, analyze=True)
+    wall_ms = (time.perf_counter() - start_time) * 1000.0
+
+    if output is None:
+        return False
+
+    result.explain_output = output
+    result.execution_time_ms = wall_ms
+    try:
+        plan = json.loads(output)
+        result.execution_time_ms = plan[0].get("Execution Time", wall_ms)
+        result.rows_affected = int(plan[0]["Plan"].get("Actual Rows", 0))
+    except (json.JSONDecodeError, ValueError, TypeError, KeyError, IndexError):
+        pass
+
+    logger.debug(
+        "Query #%d executed via EXPLAIN ANALYZE in %.2f ms (%d rows)",
+        result.query_number,
+        result.execution_time_ms,
+        result.rows_affected,
+    )
+    return True
+
+
 def _run_explain(
     connector: DatabaseConnector,
     query: str,
@@ -130,6 +355,9 @@ def _run_explain(
 ) -> Optional[str]:
     """Run EXPLAIN on a query and return the plan output.
 
+    The db_type branch is resolved once per connector and cached on it,
+    so per-SELECT dispatch is a single attribute read.
+
     Args:
         connector: Active database connector.
         query: The SELECT query to explain.
@@ -138,13 +366,13 @@ def _run_explain(
     Returns:
         The EXPLAIN output as a string, or None on failure.
     """
-    if connector.db_type == "postgres":
-        return _run_explain_postgres(connector, query, analyze)
-    elif connector.db_type == "sqlserver":
-        return _run_explain_sqlserver(connector, query)
-    elif connector.db_type == "sqlite":
-        return _run_explain_sqlite(connector, query)
-    return None
+    fn = connector._explain_fn
+    if fn is None:
+        fn = _EXPLAIN_DISPATCH.get(connector.db_type)
+        if fn is None:
+            return None
+        connector._explain_fn = fn
+    return fn(connector, query, analyze)
 
 
 def _run_explain_postgres(
@@ -156,12 +384,9 @@ def _run_explain_postgres(
 
     Uses JSON format for structured output parsing.
     """
-    explain_prefix = "EXPLAIN (FORMAT JSON, BUFFERS ON"
-    if analyze:
-        explain_prefix += ", ANALYZE ON"
-    explain_prefix += ")"
-
-    explain_query = f"{explain_prefix} {query}"
+    explain_query = (
+        _PG_EXPLAIN_ANALYZE_PREFIX if analyze else _PG_EXPLAIN_PREFIX
+    ) + query
 
     try:
         with connector.cursor() as cur:
@@ -171,10 +396,14 @@ def _run_explain_postgres(
 
             if rows:
                 # PostgreSQL returns JSON plan in first column of first row
-                import json
-
                 plan_data = rows[0][0]
                 if isinstance(plan_data, list):
+                    # Plan JSONs can be large; orjson serializes them
+                    # several times faster than stdlib json.
+                    if orjson is not None:
+                        return orjson.dumps(
+                            plan_data, option=orjson.OPT_INDENT_2
+                        ).decode()
                     return json.dumps(plan_data, indent=2)
                 return str(plan_data)
     except Exception as e:
@@ -187,31 +416,36 @@ def _run_explain_postgres(
 def _run_explain_sqlserver(
     connector: DatabaseConnector,
     query: str,
+    analyze: bool = False,
 ) -> Optional[str]:
     """Run estimated execution plan on SQL Server.
 
-    Uses SET SHOWPLAN_TEXT for text-based plan output.
+    Uses SET SHOWPLAN_TEXT for text-based plan output. ``analyze`` is
+    accepted for dispatch-signature uniformity but has no SHOWPLAN
+    equivalent and is ignored.
     """
     try:
         with connector.cursor() as cur:
             # Enable showplan
-            cur.execute("SET SHOWPLAN_TEXT ON")
+            cur.execute(_MSSQL_SHOWPLAN_ON)
             cur.execute(query)
 
-            plans = []
+            # Stream plan rows into one buffer — avoids accumulating
+            # per-row strings for large plans.
+            buf = io.StringIO()
             while True:
-                rows = cur.fetchall()
-                if rows:
-                    for row in rows:
-                        plans.append(str(row[0]))
+                for row in cur.fetchall():
+                    buf.write(str(row[0]))
+                    buf.write("\n")
                 if not cur.nextset():
                     break
 
             # Disable showplan
-            cur.execute("SET SHOWPLAN_TEXT OFF")
+            cur.execute(_MSSQL_SHOWPLAN_OFF)
             connector.commit()
 
-            return "\n".join(plans) if plans else None
+            plan_text = buf.getvalue()
+            return plan_text.rstrip("\n") if plan_text else None
     except Exception as e:
         connector.rollback()
         logger.warning("SQL Server EXPLAIN failed: %s", e)
@@ -222,10 +456,13 @@ def _run_explain_sqlserver(
 def _run_explain_sqlite(
     connector: DatabaseConnector,
     query: str,
+    analyze: bool = False,
 ) -> Optional[str]:
     """Run EXPLAIN QUERY PLAN on SQLite.
 
     Returns structured text plan output with tree indentation.
+    ``analyze`` is accepted for dispatch-signature uniformity; EXPLAIN
+    QUERY PLAN never executes the query.
     """
     explain_query = f"EXPLAIN QUERY PLAN {query}"
 
@@ -245,23 +482,36 @@ def _run_explain_sqlite(
                     detail = row[3] if len(row) > 3 else str(row)
                     nodes.append((node_id, parent_id, str(detail)))
 
-                # Calculate indent level from parent chain
-                def _get_depth(nid, node_map, depth=0):
-                    if nid not in node_map:
-                        return depth
-                    pid = node_map[nid]
-                    if pid == 0 or pid == nid:
-                        return depth
-                    return _get_depth(pid, node_map, depth + 1)
-
+                # Calculate indent level from parent chains in one
+                # O(N) pass: walk each unresolved chain upward once,
+                # then back-fill the depths of every node on the path.
                 node_map = {n[0]: n[1] for n in nodes}
-                lines = []
+                depth_cache: Dict[int, int] = {}
+                for node_id, _, _ in nodes:
+                    path = []
+                    nid = node_id
+                    while nid not in depth_cache:
+                        pid = node_map.get(nid)
+                        if pid is None or pid == 0 or pid == nid:
+                            depth_cache[nid] = 0
+                            break
+                        path.append(nid)
+                        nid = node_map[nid]
+                    base = depth_cache[nid]
+                    for offset, pnid in enumerate(reversed(path), start=1):
+                        depth_cache[pnid] = base + offset
+
+                # One shared indent string sliced per node, written
+                # straight into a buffer — no per-line f-string.
+                max_indent = "  " * max(depth_cache.values(), default=0)
+                buf = io.StringIO()
                 for node_id, parent_id, detail in nodes:
-                    depth = _get_depth(node_id, node_map)
-                    indent = "  " * depth
-                    lines.append(f"{indent}|--{detail}")
+                    buf.write(max_indent[: 2 * depth_cache[node_id]])
+                    buf.write("|--")
+                    buf.write(detail)
+                    buf.write("\n")
 
-                return "\n".join(lines)
+                return buf.getvalue().rstrip("\n")
     except Exception as e:
         connector.rollback()
         logger.warning("SQLite EXPLAIN failed: %s", e)
@@ -269,41 +519,308 @@ def _run_explain_sqlite(
     return None
 
 
+def _group_runs(
+    queries: List[tuple],
+    batch_identical: bool,
+    parallel_selects: bool,
+) -> List[tuple]:
+    """Split queries into contiguous runs that can be dispatched together.
+
+    Produces ``(kind, items)`` pairs where kind is ``"dml"`` for a run
+    of identically-shaped DML, ``"select"`` for a run of consecutive
+    SELECTs, or ``"single"`` for everything else. Runs never cross a
+    statement of another kind, so original execution order — and the
+    visibility of writes to later reads — is preserved.
+
+    Args:
+        queries: List of (sql_statement, line_number[, query_type]) tuples.
+        batch_identical: Group identically-shaped DML runs.
+        parallel_selects: Group consecutive SELECT runs.
+
+    Returns:
+        List of (kind, items) tuples.
+    """
+    runs: List[tuple] = []
+    current_kind = None
+    current_shape = None
+    for item in queries:
+        query_type = _item_type(item)
+        if batch_identical and query_type in _BATCHABLE_TYPES:
+            shape = _query_shape(item[0])
+            if current_kind == "dml" and shape == current_shape:
+                runs[-1][1].append(item)
+            else:
+                runs.append(("dml", [item]))
+                current_kind, current_shape = "dml", shape
+        elif parallel_selects and query_type == "SELECT":
+            if current_kind == "select":
+                runs[-1][1].append(item)
+            else:
+                runs.append(("select", [item]))
+                current_kind, current_shape = "select", None
+        else:
+            runs.append(("single", [item]))
+            current_kind, current_shape = None, None
+    return runs
+
+
+def _execute_select_run(
+    pool: ConnectionPool,
+    run: List[tuple],
+    start_number: int,
+    explain_analyze: bool,
+) -> List[QueryResult]:
+    """Execute a run of consecutive SELECTs concurrently over the pool.
+
+    Each worker checks a read-only connection out of the pool, runs the
+    SELECT and its EXPLAIN inline, and returns the result; map keeps
+    the original ordering.
+
+    Args:
+        pool: Open read-only connection pool.
+        run: Contiguous (sql, line_number) tuples, all SELECTs.
+        start_number: Query number of the first statement in the run.
+        explain_analyze: Whether to run EXPLAIN ANALYZE.
+
+    Returns:
+        One QueryResult per statement, in input order.
+    """
+
+    def _one(args) -> QueryResult:
+        offset, item = args
+        logger.debug(
+            "Executing query #%d (line %d)...", start_number + offset, item[1]
+        )
+        with pool.acquire() as connector:
+            return execute_query(
+                connector,
+                item[0],
+                start_number + offset,
+                explain_analyze,
+                line_number=item[1],
+                query_type=_item_type(item),
+            )
+
+    with ThreadPoolExecutor(max_workers=min(pool.size, len(run))) as worker_pool:
+        return list(worker_pool.map(_one, enumerate(run)))
+
+
+def _execute_identical_run(
+    connector: DatabaseConnector,
+    run: List[tuple],
+    start_number: int,
+) -> Optional[List[QueryResult]]:
+    """Execute a run of identically-shaped DML in one round trip.
+
+    Sends the whole run as a single script (``executescript`` on
+    SQLite, one multi-statement ``execute`` elsewhere) with one commit,
+    amortizing the measured time across the statements.
+
+    Args:
+        connector: Active database connector.
+        run: Contiguous (sql, line_number) tuples with identical shape.
+        start_number: Query number of the first statement in the run.
+
+    Returns:
+        One QueryResult per statement, or None if the batch failed —
+        the caller then falls back to per-statement execution so the
+        failing statement can be identified.
+    """
+    script = ";\n".join(item[0].rstrip().rstrip(";") for item in run) + ";"
+    try:
+        with connector.cursor() as cur:
+            start_time = time.perf_counter()
+            if connector.db_type == "sqlite":
+                cur.executescript(script)
+            else:
+                cur.execute(script)
+            elapsed_ms = (time.perf_counter() - start_time) * 1000.0
+            connector.commit()
+    except Exception as e:
+        connector.rollback()
+        logger.warning(
+            "Batched execution of %d statements failed (%s); "
+            "falling back to per-statement execution.",
+            len(run),
+            e,
+        )
+        return None
+
+    per_statement_ms = elapsed_ms / len(run)
+    results = []
+    for offset, item in enumerate(run):
+        result = QueryResult(
+            query_number=start_number + offset,
+            query_text=item[0],
+            query_type=_item_type(item),
+            line_number=item[1],
+            execution_time_ms=per_statement_ms,
+        )
+        result.warnings.append(
+            f"Executed in a batch of {len(run)} identical statements; "
+            "time shown is the batch average."
+        )
+        results.append(result)
+    logger.info(
+        "Executed %d identical statements as one batch in %.2f ms.",
+        len(run),
+        elapsed_ms,
+    )
+    return results
+
+
+# Backend EXPLAIN implementations, keyed by db_type. _run_explain
+# caches the resolved entry on the connector after the first lookup.
+_EXPLAIN_DISPATCH = {
+    "postgres": _run_explain_postgres,
+    "sqlserver": _run_explain_sqlserver,
+    "sqlite": _run_explain_sqlite,
+}
+
+
 def execute_all_queries(
     connector: DatabaseConnector,
     queries: List[tuple],
     explain_analyze: bool = False,
     continue_on_error: bool = True,
+    pool: Optional[ConnectionPool] = None,
+    batch_identical: bool = False,
+    commit_every: int = 1,
 ) -> List[QueryResult]:
     """Execute all queries sequentially and collect results.
 
     Args:
         connector: Active database connector.
-        queries: List of (sql_statement, line_number) tuples.
+        queries: List of (sql_statement, line_number[, query_type])
+            tuples as produced by split_queries; the type element is
+            optional and derived on the fly when missing.
         explain_analyze: Whether to run EXPLAIN ANALYZE for SELECT queries.
         continue_on_error: If True, continue executing after a query fails.
+        pool: Optional read-only connection pool; when provided, EXPLAINs
+            for all SELECTs are fanned out across the pool in parallel
+            after the serial execution pass.
+        batch_identical: Dispatch contiguous runs of identically-shaped
+            INSERT/UPDATE/DELETE statements in one round trip each,
+            amortizing timing across the run.
+        commit_every: Commit once per this many mutating statements
+            instead of per statement, amortizing the commit fsync.
+            With values > 1 a failing statement rolls back the whole
+            uncommitted group, so per-query timing stays intact but
+            durability is batched.
 
     Returns:
         List of QueryResult objects.
     """
     results: List[QueryResult] = []
 
-    for idx, (query, line_num) in enumerate(queries, start=1):
-        logger.info("Executing query #%d (line %d)...", idx, line_num)
-        result = execute_query(connector, query, idx, explain_analyze, line_number=line_num)
-        results.append(result)
-
-        if not result.success and not continue_on_error:
-            logger.error(
-                "Stopping execution at query #%d due to error (continue_on_error=False).",
-                idx,
-            )
-            break
+    # Pass 1: DML/DDL runs serially on the writer connection so later
+    # statements see earlier writes. Runs of consecutive SELECTs fan
+    # out across the pool; remaining EXPLAINs are deferred to pass 2.
+    runs = _group_runs(queries, batch_identical, parallel_selects=pool is not None)
+
+    idx = 0
+    stopped = False
+    defer_commits = commit_every > 1
+    pending_commits = 0
+    # One cursor serves every serial statement; batched DML and pooled
+    # SELECT runs manage their own cursors/connections.
+    with connector.cursor() as shared_cur:
+        for kind, run in runs:
+            if kind == "dml" and len(run) > 1:
+                batch_results = _execute_identical_run(connector, run, idx + 1)
+                if batch_results is not None:
+                    results.extend(batch_results)
+                    idx += len(run)
+                    continue
+            if kind == "select" and len(run) > 1:
+                # Pooled readers run on their own connections and can't
+                # see DML still uncommitted on the writer — flush any
+                # deferred commit_every group first so the
+                # read-your-writes ordering _group_runs promises holds.
+                if pending_commits:
+                    connector.commit()
+                    pending_commits = 0
+                select_results = _execute_select_run(
+                    pool, run, idx + 1, explain_analyze
+                )
+                results.extend(select_results)
+                idx += len(run)
+                if not continue_on_error and any(
+                    not r.success for r in select_results
+                ):
+                    logger.error(
+                        "Stopping execution after a failed query "
+                        "(continue_on_error=False)."
+                    )
+                    break
+                continue
+            for item in run:
+                idx += 1
+                logger.debug("Executing query #%d (line %d)...", idx, item[1])
+                result = execute_query(
+                    connector,
+                    item[0],
+                    idx,
+                    explain_analyze,
+                    line_number=item[1],
+                    run_explain=pool is None,
+                    defer_commit=defer_commits,
+                    cursor=shared_cur,
+                    query_type=_item_type(item),
+                )
+                results.append(result)
+
+                if (
+                    defer_commits
+                    and result.success
+                    and result.query_type not in _READ_ONLY_TYPES
+                ):
+                    pending_commits += 1
+                    if pending_commits >= commit_every:
+                        connector.commit()
+                        pending_commits = 0
+
+                if not result.success and not continue_on_error:
+                    logger.error(
+                        "Stopping execution at query #%d due to error (continue_on_error=False).",
+                        idx,
+                    )
+                    stopped = True
+                    break
+            if stopped:
+                break
+
+    # Flush any commits still pending from a commit_every group.
+    if pending_commits:
+        connector.commit()
+
+    # Pass 2: EXPLAINs are independent read-only round-trips — overlap
+    # them across the pooled connections instead of paying N×RTT.
+    if pool is not None:
+        explain_targets = [
+            r
+            for r in results
+            if r.success and r.query_type == "SELECT" and r.explain_output is None
+        ]
+        if explain_targets:
+            def _explain_one(result: QueryResult) -> None:
+                try:
+                    with pool.acquire() as explain_connector:
+                        result.explain_output = _run_explain(
+                            explain_connector, result.query_text, explain_analyze
+                        )
+                except Exception as e:
+                    logger.warning(
+                        "EXPLAIN failed for query #%d: %s", result.query_number, e
+                    )
+
+            with ThreadPoolExecutor(max_workers=pool.size) as executor:
+                list(executor.map(_explain_one, explain_targets))
 
     return results
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchResult:
     """Result of executing an entire SQL file as a single script."""
 
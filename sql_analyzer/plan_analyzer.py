@@ -5,18 +5,116 @@ SQL Server, and EXPLAIN QUERY PLAN output from SQLite.
 Extracts cost, timing, rows, buffers, and detects performance anti-patterns.
 """
 
+import enum
+import io
 import json
 import logging
 import re
+import sys
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson  # C-extension JSON — faster parsing of large EXPLAIN plans
+except ImportError:
+    orjson = None
+
+# Bound once at import so the per-plan parse is a straight call, not a
+# backend check.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 logger = logging.getLogger(__name__)
 
+# Text-plan extraction patterns, compiled once at import. Inline
+# re.search would re-hit the regex cache (pattern hash + dict lookup)
+# per query — measurable when plans are short.
+_TEXT_COST_RE = re.compile(r"cost=(\d+\.?\d*)\.\.([\d.]+)")
+_TEXT_ROWS_RE = re.compile(r"rows=(\d+)")
+
+# Every keyword _parse_text_plan cares about, as one alternation so a
+# single linear pass over the plan text replaces a dozen independent
+# substring scans. Longer alternatives come first so e.g.
+# "nested loops" isn't shadowed by "nested loop".
+_TEXT_KEYWORD_RE = re.compile(
+    "clustered index scan|bitmap heap scan|nested loops|nested loop|"
+    "hash join|hash match|seq scan|table scan|filter:|external|sort|disk"
+)
+_TEXT_SCAN_KEYWORDS = frozenset({"seq scan", "table scan", "clustered index scan"})
+
+# SQLite EXPLAIN QUERY PLAN line patterns, compiled once at import.
+_SQLITE_SCAN_RE = re.compile(r"SCAN\s+(\w+)", re.IGNORECASE)
+_SQLITE_SEARCH_RE = re.compile(r"SEARCH\s+(\w+)\s+USING\s+(.+)", re.IGNORECASE)
+
+# Node-type categories, built once — the walker would otherwise
+# allocate both sets afresh for every node visited. Members are
+# interned (multi-word literals aren't automatically) so membership
+# and equality checks against interned node types short-circuit on
+# pointer identity.
+_SCAN_NODE_TYPES = frozenset(map(sys.intern, (
+    "Seq Scan",
+    "Index Scan",
+    "Index Only Scan",
+    "Bitmap Index Scan",
+    "Bitmap Heap Scan",
+    "Tid Scan",
+)))
+_JOIN_NODE_TYPES = frozenset(map(sys.intern, ("Nested Loop", "Hash Join", "Merge Join")))
+
+
+class PlanIssue(enum.IntFlag):
+    """Bit flags for the anti-patterns detected in a plan.
+
+    Packed into a single ``PlanMetrics.issues`` int so scoring tests
+    one machine word instead of dereferencing eight bool attributes.
+    """
+
+    SEQUENTIAL_SCAN = enum.auto()
+    FULL_TABLE_SCAN = enum.auto()
+    NESTED_LOOP = enum.auto()
+    HASH_JOIN = enum.auto()
+    LARGE_SORT = enum.auto()
+    BITMAP_HEAP_SCAN = enum.auto()
+    TEMP_DISK_USAGE = enum.auto()
+    MISSING_INDEX = enum.auto()
+
+
+# Issues that each cost one point in _calculate_score; a popcount over
+# this mask replaces four separate branches.
+_ONE_POINT_MASK = int(
+    PlanIssue.MISSING_INDEX
+    | PlanIssue.NESTED_LOOP
+    | PlanIssue.LARGE_SORT
+    | PlanIssue.TEMP_DISK_USAGE
+)
+
+
+def _issue_flag(flag: PlanIssue) -> property:
+    """Build a bool-valued property backed by a bit in ``issues``.
 
-@dataclass
+    Keeps the ``metrics.has_x = True`` call sites and report fields
+    unchanged while the storage is a single int.
+    """
+
+    def getter(self) -> bool:
+        return bool(self.issues & flag)
+
+    def setter(self, value: bool) -> None:
+        if value:
+            self.issues |= flag
+        else:
+            self.issues &= ~flag
+
+    return property(getter, setter)
+
+
+@dataclass(slots=True)
 class PlanMetrics:
-    """Extracted metrics from a query execution plan."""
+    """Extracted metrics from a query execution plan.
+
+    Slotted: one instance is built per analyzed statement, and slots
+    drop the per-instance ``__dict__`` while making the walker's many
+    attribute updates fixed-offset loads.
+    """
 
     # Cost estimates
     startup_cost: float = 0.0
@@ -44,20 +142,28 @@ class PlanMetrics:
     scan_types: List[str] = field(default_factory=list)
     join_types: List[str] = field(default_factory=list)
     tables_scanned: List[str] = field(default_factory=list)
+    # Membership sidecar for tables_scanned: O(1) dedup instead of a
+    # list scan per node. The list keeps first-seen order for reports.
+    _tables_seen: set = field(default_factory=set, repr=False, compare=False)
 
-    # Issues detected
-    has_sequential_scan: bool = False
-    has_full_table_scan: bool = False
-    has_nested_loop: bool = False
-    has_hash_join: bool = False
-    has_large_sort: bool = False
-    has_bitmap_heap_scan: bool = False
-    has_temp_disk_usage: bool = False
-    missing_index_likely: bool = False
+    # Issues detected, packed as PlanIssue bits. The has_* names below
+    # stay available as bool properties.
+    issues: int = 0
 
     # Performance score (1-10, 10 = best)
     performance_score: int = 10
 
+    # Bool views over the issues bitfield (not fields — plain class
+    # attributes, so the dataclass machinery ignores them).
+    has_sequential_scan = _issue_flag(PlanIssue.SEQUENTIAL_SCAN)
+    has_full_table_scan = _issue_flag(PlanIssue.FULL_TABLE_SCAN)
+    has_nested_loop = _issue_flag(PlanIssue.NESTED_LOOP)
+    has_hash_join = _issue_flag(PlanIssue.HASH_JOIN)
+    has_large_sort = _issue_flag(PlanIssue.LARGE_SORT)
+    has_bitmap_heap_scan = _issue_flag(PlanIssue.BITMAP_HEAP_SCAN)
+    has_temp_disk_usage = _issue_flag(PlanIssue.TEMP_DISK_USAGE)
+    missing_index_likely = _issue_flag(PlanIssue.MISSING_INDEX)
+
 
 def analyze_query_plan(
     explain_output: Optional[str],
@@ -87,10 +193,10 @@ def analyze_query_plan(
     else:
         # Try parsing as JSON first (PostgreSQL JSON format)
         try:
-            plan_data = json.loads(explain_output)
+            plan_data = _json_loads(explain_output)
             if isinstance(plan_data, list) and len(plan_data) > 0:
                 _parse_postgres_json_plan(plan_data[0], metrics)
-        except (json.JSONDecodeError, TypeError):
+        except (json.JSONDecodeError, ValueError, TypeError):
             # Fall back to text-based parsing
             _parse_text_plan(explain_output, metrics)
 
@@ -118,14 +224,46 @@ def _parse_postgres_json_plan(plan_data: Dict[str, Any], metrics: PlanMetrics) -
         _walk_plan_node(plan_data["Plan"], metrics)
 
 
-def _walk_plan_node(node: Dict[str, Any], metrics: PlanMetrics) -> None:
-    """Recursively walk a plan node tree and extract metrics.
+def _walk_plan_node(root: Dict[str, Any], metrics: PlanMetrics) -> None:
+    """Walk a plan node tree and extract metrics.
+
+    Iterative depth-first traversal with an explicit stack — deep
+    plans (30+ levels for complex CTEs) would otherwise pay a Python
+    call frame per node and can hit the recursion limit. Children are
+    pushed reversed so nodes are visited in the same pre-order as the
+    old recursion.
+
+    Args:
+        root: The root plan node dictionary.
+        metrics: PlanMetrics to populate.
+    """
+    # Row estimates are taken from the root only: in PostgreSQL each
+    # node's row count already reflects its subtree, so summing every
+    # node massively over-counts. The root is the statement's output.
+    metrics.estimated_rows = root.get("Plan Rows", 0)
+    metrics.actual_rows = root.get("Actual Rows", 0)
+
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        _visit_plan_node(node, metrics)
+        children = node.get("Plans")
+        if children:
+            stack.extend(reversed(children))
+
+
+def _visit_plan_node(node: Dict[str, Any], metrics: PlanMetrics) -> None:
+    """Extract metrics from a single plan node.
 
     Args:
         node: A plan node dictionary.
         metrics: PlanMetrics to populate.
     """
-    node_type = node.get("Node Type", "")
+    # Intern the node type: JSON-decoded strings aren't interned, and
+    # interning makes every comparison below a pointer check for the
+    # common types (the frozensets and _NODE_HANDLERS keys are interned
+    # too).
+    node_type = sys.intern(node.get("Node Type", ""))
     metrics.node_types.append(node_type)
 
     # Extract cost
@@ -135,10 +273,6 @@ def _walk_plan_node(node: Dict[str, Any], metrics: PlanMetrics) -> None:
         metrics.total_cost = total_cost
         metrics.startup_cost = startup_cost
 
-    # Extract row estimates
-    metrics.estimated_rows += node.get("Plan Rows", 0)
-    metrics.actual_rows += node.get("Actual Rows", 0)
-
     # Extract buffer info
     if "Shared Hit Blocks" in node:
         metrics.shared_hit_blocks += node["Shared Hit Blocks"]
@@ -154,49 +288,66 @@ def _walk_plan_node(node: Dict[str, Any], metrics: PlanMetrics) -> None:
             metrics.has_temp_disk_usage = True
 
     # Detect scan types
-    scan_types = {"Seq Scan", "Index Scan", "Index Only Scan", "Bitmap Index Scan",
-                  "Bitmap Heap Scan", "Tid Scan"}
-    if node_type in scan_types:
+    if node_type in _SCAN_NODE_TYPES:
         metrics.scan_types.append(node_type)
         table = node.get("Relation Name", "unknown")
-        if table not in metrics.tables_scanned:
+        if table not in metrics._tables_seen:
+            metrics._tables_seen.add(table)
             metrics.tables_scanned.append(table)
 
-    # Detect sequential scan
-    if node_type == "Seq Scan":
-        metrics.has_sequential_scan = True
-        metrics.has_full_table_scan = True
-        # If there's a filter on Seq Scan, likely missing index
-        if node.get("Filter"):
-            metrics.missing_index_likely = True
-
-    # Detect bitmap heap scan
-    if node_type == "Bitmap Heap Scan":
-        metrics.has_bitmap_heap_scan = True
-
     # Detect join types
-    join_types = {"Nested Loop", "Hash Join", "Merge Join"}
-    if node_type in join_types:
+    if node_type in _JOIN_NODE_TYPES:
         metrics.join_types.append(node_type)
 
-    if node_type == "Nested Loop":
-        metrics.has_nested_loop = True
-    if node_type == "Hash Join":
-        metrics.has_hash_join = True
+    # Node-type-specific flags: one hash lookup instead of a branch
+    # cascade per node.
+    handler = _NODE_HANDLERS.get(node_type)
+    if handler is not None:
+        handler(node, metrics)
 
-    # Detect large sort
-    if node_type == "Sort":
-        sort_method = node.get("Sort Method", "")
-        if "disk" in sort_method.lower() or "external" in sort_method.lower():
-            metrics.has_large_sort = True
-        # Large sort by row count
-        plan_rows = node.get("Plan Rows", 0)
-        if plan_rows > 10000:
-            metrics.has_large_sort = True
 
-    # Recurse into child plans
-    for child in node.get("Plans", []):
-        _walk_plan_node(child, metrics)
+def _handle_seq_scan(node: Dict[str, Any], metrics: PlanMetrics) -> None:
+    """Flag a sequential scan; a filtered one suggests a missing index."""
+    metrics.has_sequential_scan = True
+    metrics.has_full_table_scan = True
+    if node.get("Filter"):
+        metrics.missing_index_likely = True
+
+
+def _handle_bitmap_heap_scan(node: Dict[str, Any], metrics: PlanMetrics) -> None:
+    """Flag a bitmap heap scan."""
+    metrics.has_bitmap_heap_scan = True
+
+
+def _handle_nested_loop(node: Dict[str, Any], metrics: PlanMetrics) -> None:
+    """Flag a nested-loop join."""
+    metrics.has_nested_loop = True
+
+
+def _handle_hash_join(node: Dict[str, Any], metrics: PlanMetrics) -> None:
+    """Flag a hash join."""
+    metrics.has_hash_join = True
+
+
+def _handle_sort(node: Dict[str, Any], metrics: PlanMetrics) -> None:
+    """Flag sorts that spill to disk or cover large row counts."""
+    sort_method = node.get("Sort Method", "").lower()
+    if "disk" in sort_method or "external" in sort_method:
+        metrics.has_large_sort = True
+    # Large sort by row count
+    if node.get("Plan Rows", 0) > 10000:
+        metrics.has_large_sort = True
+
+
+# Per-node-type flag handlers, dispatched by a single dict lookup.
+# Keys interned to match the interned node types from the visitor.
+_NODE_HANDLERS = {
+    sys.intern("Seq Scan"): _handle_seq_scan,
+    sys.intern("Bitmap Heap Scan"): _handle_bitmap_heap_scan,
+    sys.intern("Nested Loop"): _handle_nested_loop,
+    sys.intern("Hash Join"): _handle_hash_join,
+    sys.intern("Sort"): _handle_sort,
+}
 
 
 def _parse_text_plan(explain_text: str, metrics: PlanMetrics) -> None:
@@ -206,41 +357,43 @@ def _parse_text_plan(explain_text: str, metrics: PlanMetrics) -> None:
         explain_text: Text EXPLAIN output.
         metrics: PlanMetrics to populate.
     """
-    lines = explain_text.lower()
+    # One pass over the lowered text collects every keyword of interest;
+    # the flag logic below then works off the match set.
+    found = set(_TEXT_KEYWORD_RE.findall(explain_text.lower()))
 
     # Detect scan types
-    if "seq scan" in lines or "table scan" in lines or "clustered index scan" in lines:
+    if found & _TEXT_SCAN_KEYWORDS:
         metrics.has_sequential_scan = True
         metrics.has_full_table_scan = True
 
-    if "nested loop" in lines or "nested loops" in lines:
+    if "nested loop" in found or "nested loops" in found:
         metrics.has_nested_loop = True
         metrics.join_types.append("Nested Loop")
 
-    if "hash join" in lines or "hash match" in lines:
+    if "hash join" in found or "hash match" in found:
         metrics.has_hash_join = True
         metrics.join_types.append("Hash Join")
 
-    if "bitmap heap scan" in lines:
+    if "bitmap heap scan" in found:
         metrics.has_bitmap_heap_scan = True
 
-    if "sort" in lines:
-        if "disk" in lines or "external" in lines:
+    if "sort" in found:
+        if "disk" in found or "external" in found:
             metrics.has_large_sort = True
 
     # Extract cost from text format (cost=X..Y)
-    cost_match = re.search(r"cost=(\d+\.?\d*)\.\.([\d.]+)", explain_text)
+    cost_match = _TEXT_COST_RE.search(explain_text)
     if cost_match:
         metrics.startup_cost = float(cost_match.group(1))
         metrics.total_cost = float(cost_match.group(2))
 
     # Extract rows from text format
-    rows_match = re.search(r"rows=(\d+)", explain_text)
+    rows_match = _TEXT_ROWS_RE.search(explain_text)
     if rows_match:
         metrics.estimated_rows = int(rows_match.group(1))
 
     # Check for missing index hints
-    if "filter:" in lines and "seq scan" in lines:
+    if "filter:" in found and "seq scan" in found:
         metrics.missing_index_likely = True
 
 
@@ -261,46 +414,54 @@ def _parse_sqlite_plan(explain_text: str, metrics: PlanMetrics) -> None:
         explain_text: SQLite EXPLAIN QUERY PLAN text output.
         metrics: PlanMetrics to populate.
     """
-    for raw_line in explain_text.splitlines():
+    # StringIO yields one line at a time from its C buffer instead of
+    # splitlines() materializing the whole plan as a list up front.
+    for raw_line in io.StringIO(explain_text):
         line = raw_line.strip().lstrip("|- ")
         line_lower = line.lower()
 
+        # Dispatch on the first keyword so only the applicable regex
+        # (if any) runs against the line.
+        head = line[:6].upper()
+
         # --- SCAN (full table scan, no index) ---
-        scan_match = re.match(r"SCAN\s+(\w+)", line, re.IGNORECASE)
-        if scan_match:
-            table = scan_match.group(1)
-            metrics.node_types.append("SCAN")
-            metrics.scan_types.append("Full Table Scan")
-            if table not in metrics.tables_scanned:
-                metrics.tables_scanned.append(table)
-            metrics.has_sequential_scan = True
-            metrics.has_full_table_scan = True
-            # If there's a filter (WHERE) on a SCAN, index is likely missing
-            metrics.missing_index_likely = True
-            continue
+        if head.startswith("SCAN"):
+            scan_match = _SQLITE_SCAN_RE.match(line)
+            if scan_match:
+                table = scan_match.group(1)
+                metrics.node_types.append("SCAN")
+                metrics.scan_types.append("Full Table Scan")
+                if table not in metrics._tables_seen:
+                    metrics._tables_seen.add(table)
+                    metrics.tables_scanned.append(table)
+                metrics.has_sequential_scan = True
+                metrics.has_full_table_scan = True
+                # If there's a filter (WHERE) on a SCAN, index is likely missing
+                metrics.missing_index_likely = True
+                continue
 
         # --- SEARCH with index ---
-        search_match = re.match(
-            r"SEARCH\s+(\w+)\s+USING\s+(.+)", line, re.IGNORECASE
-        )
-        if search_match:
-            table = search_match.group(1)
-            using_detail = search_match.group(2).strip()
-            metrics.node_types.append("SEARCH")
-            if table not in metrics.tables_scanned:
-                metrics.tables_scanned.append(table)
-
-            if "covering index" in using_detail.lower():
-                metrics.scan_types.append("Covering Index Scan")
-            elif "integer primary key" in using_detail.lower():
-                metrics.scan_types.append("Primary Key Lookup")
-            elif "automatic" in using_detail.lower():
-                # Auto-index created by SQLite — not ideal
-                metrics.scan_types.append("Automatic Index")
-                metrics.missing_index_likely = True
-            else:
-                metrics.scan_types.append("Index Scan")
-            continue
+        if head == "SEARCH":
+            search_match = _SQLITE_SEARCH_RE.match(line)
+            if search_match:
+                table = search_match.group(1)
+                using_detail = search_match.group(2).strip()
+                metrics.node_types.append("SEARCH")
+                if table not in metrics._tables_seen:
+                    metrics._tables_seen.add(table)
+                    metrics.tables_scanned.append(table)
+
+                if "covering index" in using_detail.lower():
+                    metrics.scan_types.append("Covering Index Scan")
+                elif "integer primary key" in using_detail.lower():
+                    metrics.scan_types.append("Primary Key Lookup")
+                elif "automatic" in using_detail.lower():
+                    # Auto-index created by SQLite — not ideal
+                    metrics.scan_types.append("Automatic Index")
+                    metrics.missing_index_likely = True
+                else:
+                    metrics.scan_types.append("Index Scan")
+                continue
 
         # --- USING TEMPORARY B-TREE (sort / group / distinct) ---
         if "temporary b-tree" in line_lower or "temp b-tree" in line_lower:
@@ -352,25 +513,13 @@ def _calculate_score(metrics: PlanMetrics, slow_threshold_ms: float) -> int:
     elif metrics.execution_time_ms > slow_threshold_ms / 2:
         score -= 1
 
-    # Deduct for sequential / full table scan
-    if metrics.has_sequential_scan:
+    # Deduct for detected issues: one read of the bitfield, then a
+    # branch for the 2-point sequential scan and a popcount over the
+    # 1-point mask (missing index, nested loop, large sort, temp disk).
+    issues = metrics.issues
+    if issues & PlanIssue.SEQUENTIAL_SCAN:
         score -= 2
-
-    # Deduct for missing index
-    if metrics.missing_index_likely:
-        score -= 1
-
-    # Deduct for nested loops (can be expensive)
-    if metrics.has_nested_loop:
-        score -= 1
-
-    # Deduct for large sort operations
-    if metrics.has_large_sort:
-        score -= 1
-
-    # Deduct for temporary disk usage
-    if metrics.has_temp_disk_usage:
-        score -= 1
+    score -= (issues & _ONE_POINT_MASK).bit_count()
 
     # Deduct for high cost
     if metrics.total_cost > 10000:
@@ -5,12 +5,23 @@ query execution results and performance analysis.
 """
 
 import csv
+import heapq
 import json
 import logging
+import os
+import sys
+from dataclasses import dataclass
+from itertools import chain
 from typing import Any, Dict, List
 
-from rich.console import Console
+try:
+    import orjson  # C-extension JSON — noticeably faster on large reports
+except ImportError:
+    orjson = None
+
+from rich.console import Console, Group
 from rich.panel import Panel
+from rich.style import Style
 from rich.table import Table
 from rich.text import Text
 
@@ -19,7 +30,83 @@ from .sql_parser import truncate_query_text
 
 logger = logging.getLogger(__name__)
 
-console = Console()
+
+def _write_block(lines: List[str]) -> None:
+    """Write a block of plain-text lines in one stdout call.
+
+    The plain printers used to issue one print() (and potentially one
+    syscall) per line; joining first cuts that to a single write.
+
+    Args:
+        lines: Lines to emit, without trailing newlines.
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+
+# truncate_query_text memoizes at the source now; the short alias keeps
+# the call sites below readable.
+_truncate = truncate_query_text
+
+# highlight/emoji run extra regex passes over every printed segment;
+# the report output styles everything explicitly, so both are off.
+console = Console(highlight=False, emoji=False)
+
+# Styles used by the Text-based panel builder, parsed once at import —
+# passing a style string makes Rich parse it on every append.
+_BOLD = Style(bold=True)
+_DIM = Style(dim=True)
+_MAGENTA = Style(color="magenta")
+_CYAN = Style(color="cyan")
+_RED = Style(color="red")
+_GREEN = Style(color="green")
+_YELLOW = Style(color="yellow")
+_BRIGHT_GREEN = Style(color="bright_green")
+_BRIGHT_WHITE = Style(color="bright_white")
+_BOLD_WHITE = Style(color="white", bold=True)
+_BOLD_YELLOW = Style(color="yellow", bold=True)
+_BOLD_CYAN = Style(color="cyan", bold=True)
+
+# Performance score (0-10) → display color, one index instead of an
+# if/elif chain per rendered result: <5 red, 5-7 yellow, 8+ green.
+_SCORE_COLOR = ("red",) * 5 + ("yellow",) * 3 + ("green",) * 3
+_SCORE_STYLE = tuple(Style(color=c) for c in _SCORE_COLOR)
+# Ready "[color]N/10[/color]" strings for the markup-based printers.
+_SCORE_MARKUP = tuple(
+    f"[{c}]{s}/10[/{c}]" for s, c in enumerate(_SCORE_COLOR)
+)
+
+# The four possible status badges, formatted once:
+# (border_style, icon text, icon Style, icon markup).
+_STATUS_FAILED = ("red", "✗ FAILED", _RED, "[red]✗ FAILED[/red]")
+_STATUS_SLOW = ("yellow", "⚠ SLOW", _YELLOW, "[yellow]⚠ SLOW[/yellow]")
+_STATUS_NEEDS_OPT = (
+    "yellow",
+    "⚠ NEEDS OPTIMIZATION",
+    _YELLOW,
+    "[yellow]⚠ NEEDS OPTIMIZATION[/yellow]",
+)
+_STATUS_OK = ("green", "✓ OK", _GREEN, "[green]✓ OK[/green]")
+
+
+def _status_style(result: QueryResult) -> tuple:
+    """Pick the status badge for a result.
+
+    Shared by both rich printers, which previously carried identical
+    if/elif ladders.
+
+    Args:
+        result: The query result being rendered.
+
+    Returns:
+        One of the precomputed _STATUS_* tuples.
+    """
+    if not result.success:
+        return _STATUS_FAILED
+    if result.is_slow:
+        return _STATUS_SLOW
+    score = result.performance_score
+    if score is not None and score <= 4:
+        return _STATUS_NEEDS_OPT
+    return _STATUS_OK
 
 
 def print_batch_result(result: BatchResult, colored: bool = True) -> None:
@@ -50,37 +137,57 @@ def print_batch_result(result: BatchResult, colored: bool = True) -> None:
         console.print(Panel("\n".join(lines), border_style=border, expand=True))
     else:
         sep = "=" * 60
-        print(sep)
         status = "SUCCESS" if result.success else "FAILED"
-        print(f"Batch Execution: {status}")
-        print(f"Statements:      {result.total_statements}")
-        print(f"Total Time:      {result.execution_time_ms:.2f} ms")
-        print(f"Rows Affected:   {result.rows_affected}")
+        out = [
+            sep,
+            f"Batch Execution: {status}",
+            f"Statements:      {result.total_statements}",
+            f"Total Time:      {result.execution_time_ms:.2f} ms",
+            f"Rows Affected:   {result.rows_affected}",
+        ]
         if not result.success:
-            print(f"Error: {result.error_message}")
-        print(sep)
+            out.append(f"Error: {result.error_message}")
+        out.append(sep)
+        _write_block(out)
+
+
+def _is_unremarkable(result: QueryResult) -> bool:
+    """Whether a result would render an all-green panel with no findings."""
+    return (
+        result.success
+        and not result.is_slow
+        and not result.warnings
+        and not result.suggestions
+    )
 
 
-def print_query_result(result: QueryResult, colored: bool = True) -> None:
+def print_query_result(result: QueryResult, colored: bool = True, verbose: bool = True) -> None:
     """Print a single query result to the console.
 
     Args:
         result: QueryResult to display.
         colored: Whether to use colored output.
+        verbose: When False, skip clean fast queries entirely — on
+            all-green runs this avoids rendering a panel per result.
     """
+    if not verbose and _is_unremarkable(result):
+        return
     if colored:
         _print_query_result_rich(result)
     else:
         _print_query_result_plain(result)
 
 
-def print_query_result_compact(result: QueryResult, colored: bool = True) -> None:
+def print_query_result_compact(result: QueryResult, colored: bool = True, verbose: bool = True) -> None:
     """Print a compact query result without execution plan or AI suggestions.
 
     Args:
         result: QueryResult to display.
         colored: Whether to use colored output.
+        verbose: When False, skip clean fast queries entirely.
     """
+    if not verbose and _is_unremarkable(result):
+        return
     if colored:
         _print_query_result_compact_rich(result)
     else:
@@ -103,92 +210,78 @@ def print_query_detail(result: QueryResult, colored: bool = True) -> None:
 def _print_query_result_rich(result: QueryResult) -> None:
     """Print query result using Rich library for colored output."""
     # Determine panel color based on status
-    if not result.success:
-        border_style = "red"
-        status_icon = "[red]✗ FAILED[/red]"
-    elif result.is_slow:
-        border_style = "yellow"
-        status_icon = "[yellow]⚠ SLOW[/yellow]"
-    elif result.performance_score is not None and result.performance_score <= 4:
-        border_style = "yellow"
-        status_icon = "[yellow]⚠ NEEDS OPTIMIZATION[/yellow]"
-    else:
-        border_style = "green"
-        status_icon = "[green]✓ OK[/green]"
-
-    # Build content
-    lines = []
-    line_info = f"  [magenta](line {result.line_number})[/magenta]" if result.line_number else ""
-    lines.append(f"[bold]Query #{result.query_number}[/bold]{line_info}  {status_icon}")
-    lines.append(f"[dim]{truncate_query_text(result.query_text, 120)}[/dim]")
-    lines.append("")
+    border_style, status_icon, status_style, _ = _status_style(result)
+
+    # Build content as a Text of styled segments — skips the markup
+    # tokenizer that a [style]-tagged string would pay at render time.
+    # The preparsed Style objects also spare Rich a style-string parse
+    # per segment.
+    txt = Text()
+    txt.append(f"Query #{result.query_number}", style=_BOLD)
+    if result.line_number:
+        txt.append(f"  (line {result.line_number})", style=_MAGENTA)
+    txt.append("  ")
+    txt.append(status_icon, style=status_style)
+    txt.append("\n")
+    txt.append(_truncate(result.query_text, 120), style=_DIM)
+    txt.append("\n")
 
     if result.success:
-        lines.append(f"Execution Time: [cyan]{result.execution_time_ms:.2f} ms[/cyan]")
-        lines.append(f"Rows Affected:  [cyan]{result.rows_affected}[/cyan]")
-        lines.append(f"Query Type:     [cyan]{result.query_type}[/cyan]")
+        txt.append("\nExecution Time: ")
+        txt.append(f"{result.execution_time_ms:.2f} ms", style=_CYAN)
+        txt.append("\nRows Affected:  ")
+        txt.append(str(result.rows_affected), style=_CYAN)
+        txt.append("\nQuery Type:     ")
+        txt.append(result.query_type, style=_CYAN)
 
         if result.performance_score is not None:
             score = result.performance_score
-            if score >= 8:
-                score_color = "green"
-            elif score >= 5:
-                score_color = "yellow"
-            else:
-                score_color = "red"
-            lines.append(
-                f"Perf Score:     [{score_color}]{score}/10[/{score_color}]"
-            )
+            txt.append("\nPerf Score:     ")
+            txt.append(f"{score}/10", style=_SCORE_STYLE[score])
 
-        # Execution plan detail
+        # Execution plan detail — one styled segment for the whole
+        # plan instead of an append per line; EXPLAIN ANALYZE output
+        # can run to hundreds of lines.
         if result.explain_output:
-            lines.append("")
-            lines.append("[bold white]Execution Plan:[/bold white]")
-            for plan_line in result.explain_output.splitlines():
-                lines.append(f"  [dim]{plan_line}[/dim]")
+            txt.append("\n\n")
+            txt.append("Execution Plan:", style=_BOLD_WHITE)
+            txt.append("\n  " + "\n  ".join(result.explain_lines), style=_DIM)
     else:
-        lines.append(f"[red]Error: {result.error_message}[/red]")
+        txt.append("\n")
+        txt.append(f"Error: {result.error_message}", style=_RED)
 
     # Warnings
     if result.warnings:
-        lines.append("")
-        lines.append("[bold yellow]Performance Warnings:[/bold yellow]")
+        txt.append("\n\n")
+        txt.append("Performance Warnings:", style=_BOLD_YELLOW)
         for w in result.warnings:
-            lines.append(f"  [yellow]• {w}[/yellow]")
+            txt.append(f"\n  • {w}", style=_YELLOW)
 
     # Suggestions
     if result.suggestions:
-        lines.append("")
-        lines.append("[bold cyan]Suggestions:[/bold cyan]")
+        txt.append("\n\n")
+        txt.append("Suggestions:", style=_BOLD_CYAN)
         for s in result.suggestions:
             if s.startswith("[AI]"):
-                lines.append(f"  [bright_green]{s}[/bright_green]")
+                txt.append(f"\n  {s}", style=_BRIGHT_GREEN)
             else:
-                lines.append(f"  [bright_white]→ {s}[/bright_white]")
+                txt.append(f"\n  → {s}", style=_BRIGHT_WHITE)
 
-    content = "\n".join(lines)
-    console.print(Panel(content, border_style=border_style, expand=True))
+    console.print(
+        Panel(txt, border_style=border_style, expand=True),
+        markup=False,
+        highlight=False,
+    )
 
 
 def _print_query_result_compact_rich(result: QueryResult) -> None:
     """Print compact query result using Rich (no execution plan or AI suggestions)."""
-    if not result.success:
-        border_style = "red"
-        status_icon = "[red]\u2717 FAILED[/red]"
-    elif result.is_slow:
-        border_style = "yellow"
-        status_icon = "[yellow]\u26a0 SLOW[/yellow]"
-    elif result.performance_score is not None and result.performance_score <= 4:
-        border_style = "yellow"
-        status_icon = "[yellow]\u26a0 NEEDS OPTIMIZATION[/yellow]"
-    else:
-        border_style = "green"
-        status_icon = "[green]\u2713 OK[/green]"
+    border_style, _, _, status_icon = _status_style(result)
 
     lines = []
     line_info = f"  [magenta](line {result.line_number})[/magenta]" if result.line_number else ""
     lines.append(f"[bold]Query #{result.query_number}[/bold]{line_info}  {status_icon}")
-    lines.append(f"[dim]{truncate_query_text(result.query_text, 120)}[/dim]")
+    lines.append(f"[dim]{_truncate(result.query_text, 120)}[/dim]")
     lines.append("")
 
     if result.success:
@@ -197,15 +290,8 @@ def _print_query_result_compact_rich(result: QueryResult) -> None:
         lines.append(f"Query Type:     [cyan]{result.query_type}[/cyan]")
 
         if result.performance_score is not None:
-            score = result.performance_score
-            if score >= 8:
-                score_color = "green"
-            elif score >= 5:
-                score_color = "yellow"
-            else:
-                score_color = "red"
             lines.append(
-                f"Perf Score:     [{score_color}]{score}/10[/{score_color}]"
+                f"Perf Score:     {_SCORE_MARKUP[result.performance_score]}"
             )
     else:
         lines.append(f"[red]Error: {result.error_message}[/red]")
@@ -217,8 +303,12 @@ def _print_query_result_compact_rich(result: QueryResult) -> None:
         for w in result.warnings:
             lines.append(f"  [yellow]\u2022 {w}[/yellow]")
 
+    # Cached partition on the result — computed once even when the
+    # compact, detail, and plain printers all render the same query.
+    non_ai_suggestions = result.non_ai_suggestions
+    has_ai = bool(result.ai_suggestions)
+
     # Non-AI suggestions only (still shown in compact view)
-    non_ai_suggestions = [s for s in result.suggestions if not s.startswith("[AI]")]
     if non_ai_suggestions:
         lines.append("")
         lines.append("[bold cyan]Suggestions:[/bold cyan]")
@@ -227,7 +317,6 @@ def _print_query_result_compact_rich(result: QueryResult) -> None:
 
     # Hint about available details
     has_plan = bool(result.explain_output)
-    has_ai = any(s.startswith("[AI]") for s in result.suggestions)
     if has_plan or has_ai:
         lines.append("")
         detail_parts = []
@@ -247,42 +336,49 @@ def _print_query_result_compact_rich(result: QueryResult) -> None:
 def _print_query_result_compact_plain(result: QueryResult) -> None:
     """Print compact query result in plain text (no execution plan or AI)."""
     sep = "-" * 60
-    print(sep)
     line_info = f" (line {result.line_number})" if result.line_number else ""
-    print(f"Query #{result.query_number}{line_info}")
-    print(f"SQL: {truncate_query_text(result.query_text, 120)}")
+    out = [
+        sep,
+        f"Query #{result.query_number}{line_info}",
+        f"SQL: {_truncate(result.query_text, 120)}",
+    ]
 
     if result.success:
-        print(f"Execution Time: {result.execution_time_ms:.2f} ms")
-        print(f"Rows Affected: {result.rows_affected}")
-        print(f"Query Type: {result.query_type}")
+        out.append(f"Execution Time: {result.execution_time_ms:.2f} ms")
+        out.append(f"Rows Affected: {result.rows_affected}")
+        out.append(f"Query Type: {result.query_type}")
         if result.performance_score is not None:
-            print(f"Performance Score: {result.performance_score}/10")
+            out.append(f"Performance Score: {result.performance_score}/10")
     else:
-        print(f"ERROR: {result.error_message}")
+        out.append(f"ERROR: {result.error_message}")
 
     if result.warnings:
-        print("Performance Warnings:")
+        out.append("Performance Warnings:")
         for w in result.warnings:
-            print(f"  - {w}")
+            out.append(f"  - {w}")
+
+    non_ai_suggestions = result.non_ai_suggestions
+    has_ai = bool(result.ai_suggestions)
 
-    non_ai_suggestions = [s for s in result.suggestions if not s.startswith("[AI]")]
     if non_ai_suggestions:
-        print("Suggestions:")
+        out.append("Suggestions:")
         for s in non_ai_suggestions:
-            print(f"  - {s}")
+            out.append(f"  - {s}")
 
     has_plan = bool(result.explain_output)
-    has_ai = any(s.startswith("[AI]") for s in result.suggestions)
     if has_plan or has_ai:
         detail_parts = []
         if has_plan:
             detail_parts.append("execution plan")
         if has_ai:
             detail_parts.append("AI recommendation")
-        print(f"  [i] {' & '.join(detail_parts)} available — enter query #{result.query_number} after summary to view")
+        out.append(
+            f"  [i] {' & '.join(detail_parts)} available — "
+            f"enter query #{result.query_number} after summary to view"
+        )
 
-    print(sep)
+    out.append(sep)
+    _write_block(out)
 
 
 def _print_query_detail_rich(result: QueryResult) -> None:
@@ -290,17 +386,19 @@ def _print_query_detail_rich(result: QueryResult) -> None:
     lines = []
     line_info = f"  [magenta](line {result.line_number})[/magenta]" if result.line_number else ""
     lines.append(f"[bold]Query #{result.query_number}[/bold]{line_info}")
-    lines.append(f"[dim]{truncate_query_text(result.query_text, 120)}[/dim]")
+    lines.append(f"[dim]{_truncate(result.query_text, 120)}[/dim]")
     lines.append("")
 
     if result.explain_output:
         lines.append("[bold white]Execution Plan:[/bold white]")
-        for plan_line in result.explain_output.splitlines():
-            lines.append(f"  [dim]{plan_line}[/dim]")
+        # One dim-wrapped block for the whole plan, not a string per line.
+        lines.append(
+            "  [dim]" + "[/dim]\n  [dim]".join(result.explain_lines) + "[/dim]"
+        )
     else:
         lines.append("[dim]No execution plan available for this query.[/dim]")
 
-    ai_suggestions = [s for s in result.suggestions if s.startswith("[AI]")]
+    ai_suggestions = result.ai_suggestions
     if ai_suggestions:
         lines.append("")
         lines.append("[bold bright_green]AI Recommendations:[/bold bright_green]")
@@ -314,62 +412,127 @@ def _print_query_detail_rich(result: QueryResult) -> None:
 def _print_query_detail_plain(result: QueryResult) -> None:
     """Print execution plan and AI suggestions in plain text."""
     sep = "=" * 60
-    print(sep)
     line_info = f" (line {result.line_number})" if result.line_number else ""
-    print(f"Query #{result.query_number}{line_info} — Detail View")
-    print(f"SQL: {truncate_query_text(result.query_text, 120)}")
-    print()
+    out = [
+        sep,
+        f"Query #{result.query_number}{line_info} — Detail View",
+        f"SQL: {_truncate(result.query_text, 120)}",
+        "",
+    ]
 
     if result.explain_output:
-        print("Execution Plan:")
-        for plan_line in result.explain_output.splitlines():
-            print(f"  {plan_line}")
+        out.append("Execution Plan:")
+        out.append("  " + "\n  ".join(result.explain_lines))
     else:
-        print("No execution plan available for this query.")
+        out.append("No execution plan available for this query.")
 
-    ai_suggestions = [s for s in result.suggestions if s.startswith("[AI]")]
+    ai_suggestions = result.ai_suggestions
     if ai_suggestions:
-        print("\nAI Recommendations:")
+        out.append("\nAI Recommendations:")
         for s in ai_suggestions:
-            print(f"  {s}")
+            out.append(f"  {s}")
 
-    print(sep)
+    out.append(sep)
+    _write_block(out)
 
 
 def _print_query_result_plain(result: QueryResult) -> None:
     """Print query result in plain text format."""
     sep = "-" * 60
-    print(sep)
     line_info = f" (line {result.line_number})" if result.line_number else ""
-    print(f"Query #{result.query_number}{line_info}")
-    print(f"SQL: {truncate_query_text(result.query_text, 120)}")
+    out = [
+        sep,
+        f"Query #{result.query_number}{line_info}",
+        f"SQL: {_truncate(result.query_text, 120)}",
+    ]
 
     if result.success:
-        print(f"Execution Time: {result.execution_time_ms:.2f} ms")
-        print(f"Rows Affected: {result.rows_affected}")
-        print(f"Query Type: {result.query_type}")
+        out.append(f"Execution Time: {result.execution_time_ms:.2f} ms")
+        out.append(f"Rows Affected: {result.rows_affected}")
+        out.append(f"Query Type: {result.query_type}")
 
         if result.performance_score is not None:
-            print(f"Performance Score: {result.performance_score}/10")
+            out.append(f"Performance Score: {result.performance_score}/10")
 
         if result.explain_output:
-            print("Execution Plan:")
-            for plan_line in result.explain_output.splitlines():
-                print(f"  {plan_line}")
+            out.append("Execution Plan:")
+            out.append("  " + "\n  ".join(result.explain_lines))
     else:
-        print(f"ERROR: {result.error_message}")
+        out.append(f"ERROR: {result.error_message}")
 
     if result.warnings:
-        print("Performance Warnings:")
+        out.append("Performance Warnings:")
         for w in result.warnings:
-            print(f"  - {w}")
+            out.append(f"  - {w}")
 
     if result.suggestions:
-        print("Suggestions:")
+        out.append("Suggestions:")
         for s in result.suggestions:
-            print(f"  - {s}")
+            out.append(f"  - {s}")
+
+    out.append(sep)
+    _write_block(out)
+
+
+@dataclass(slots=True)
+class _SummaryStats:
+    """Aggregate counters computed in one pass over the results."""
 
-    print(sep)
+    total_queries: int = 0
+    successful: int = 0
+    failed: int = 0
+    slow: int = 0
+    total_time_ms: float = 0.0
+
+
+def _prepare_report_data(
+    results: List[QueryResult],
+) -> "tuple[_SummaryStats, List[QueryResult]]":
+    """Accumulate summary counters and the top-3 slowest in one pass.
+
+    print_summary and save_json_report both need the same aggregates
+    and slow-query ranking; one loop feeding a 3-element heap replaces
+    the counter sweeps and the separate nlargest pass.
+
+    Args:
+        results: All query results.
+
+    Returns:
+        Tuple of (stats, top_slow) where top_slow is the up-to-3
+        slowest successful results, slowest first.
+    """
+    # Accumulate into locals — plain fast-local loads/stores in the
+    # loop instead of an attribute descriptor hit per row — and build
+    # the stats object once at the end.
+    total_time = 0.0
+    successful = failed = slow = 0
+    heap: List[tuple] = []
+    heappush = heapq.heappush
+    heapreplace = heapq.heapreplace
+    for idx, r in enumerate(results):
+        elapsed = r.execution_time_ms
+        total_time += elapsed
+        if r.success:
+            successful += 1
+            if len(heap) < 3:
+                heappush(heap, (elapsed, -idx, r))
+            elif elapsed > heap[0][0]:
+                heapreplace(heap, (elapsed, -idx, r))
+        else:
+            failed += 1
+        if r.is_slow:
+            slow += 1
+    stats = _SummaryStats(
+        total_queries=len(results),
+        successful=successful,
+        failed=failed,
+        slow=slow,
+        total_time_ms=total_time,
+    )
+    # Slowest first; ties keep original order (higher -idx == earlier).
+    heap.sort(reverse=True)
+    top_slow = [entry[2] for entry in heap]
+    return stats, top_slow
 
 
 def print_summary(results: List[QueryResult], colored: bool = True) -> None:
@@ -379,24 +542,20 @@ def print_summary(results: List[QueryResult], colored: bool = True) -> None:
         results: All query results.
         colored: Whether to use colored output.
     """
-    total_time = sum(r.execution_time_ms for r in results)
-    successful = sum(1 for r in results if r.success)
-    failed = sum(1 for r in results if not r.success)
-    slow_count = sum(1 for r in results if r.is_slow)
-
-    # Top 3 slowest queries
-    sorted_by_time = sorted(
-        [r for r in results if r.success],
-        key=lambda r: r.execution_time_ms,
-        reverse=True,
-    )
-    top_slow = sorted_by_time[:3]
+    stats, top_slow = _prepare_report_data(results)
+    total_time = stats.total_time_ms
+    successful = stats.successful
+    failed = stats.failed
+    slow_count = stats.slow
 
     if colored:
-        console.print()
-        console.print(
-            Panel("[bold]Execution Summary[/bold]", border_style="cyan", expand=True)
-        )
+        # Collect every renderable and emit one console.print at the
+        # end — each print call pays markup parsing and ANSI rendering,
+        # so one grouped render beats a dozen small ones.
+        renderables: List[Any] = [
+            Text(),
+            Panel("[bold]Execution Summary[/bold]", border_style="cyan", expand=True),
+        ]
 
         summary_table = Table(show_header=False, box=None)
         summary_table.add_column("Metric", style="bold")
@@ -408,12 +567,12 @@ def print_summary(results: List[QueryResult], colored: bool = True) -> None:
         summary_table.add_row("Slow Queries", str(slow_count))
         summary_table.add_row("Total Execution Time", f"{total_time:.2f} ms")
 
-        console.print(summary_table)
+        renderables.append(summary_table)
 
         # Top slowest
         if top_slow:
-            console.print()
-            console.print("[bold yellow]Top 3 Slowest Queries:[/bold yellow]")
+            renderables.append(Text())
+            renderables.append(Text("Top 3 Slowest Queries:", style=_BOLD_YELLOW))
             slow_table = Table()
             slow_table.add_column("#", style="bold")
             slow_table.add_column("Line", style="magenta")
@@ -421,53 +580,84 @@ def print_summary(results: List[QueryResult], colored: bool = True) -> None:
             slow_table.add_column("Score", style="yellow")
             slow_table.add_column("Query", style="dim")
 
-            for r in top_slow:
-                score_str = f"{r.performance_score}/10" if r.performance_score else "N/A"
-                slow_table.add_row(
+            # Pre-format every cell once; add_row gets ready strings so
+            # Rich only measures, never formats.
+            rows = [
+                (
                     str(r.query_number),
-                    str(r.line_number) if r.line_number else "-",
-                    f"{r.execution_time_ms:.2f}",
-                    score_str,
-                    truncate_query_text(r.query_text, 80),
+                    str(r.line_number or "-"),
+                    format(r.execution_time_ms, ".2f"),
+                    f"{r.performance_score}/10" if r.performance_score else "N/A",
+                    _truncate(r.query_text, 80),
                 )
-            console.print(slow_table)
-
-        # Optimization summary
-        all_suggestions = []
-        for r in results:
-            all_suggestions.extend(r.suggestions)
-        unique_suggestions = list(dict.fromkeys(all_suggestions))
+                for r in top_slow
+            ]
+            for row in rows:
+                slow_table.add_row(*row)
+            renderables.append(slow_table)
+
+        # Optimization summary — dedup straight off the chained
+        # iterator, no intermediate concatenated list.
+        unique_suggestions = list(
+            dict.fromkeys(chain.from_iterable(r.suggestions for r in results))
+        )
 
         if unique_suggestions:
-            console.print()
-            console.print("[bold cyan]Optimization Summary:[/bold cyan]")
+            # Styled appends onto one Text — no markup string to tokenize
+            # per suggestion line at render time.
+            suggestion_text = Text("\nOptimization Summary:", style=_BOLD_CYAN)
             for idx, s in enumerate(unique_suggestions[:10], 1):
-                if s.startswith("[AI]"):
-                    console.print(f"  [bright_green]{idx}. {s}[/bright_green]")
-                else:
-                    console.print(f"  [bright_white]{idx}. {s}[/bright_white]")
+                style = _BRIGHT_GREEN if s.startswith("[AI]") else _BRIGHT_WHITE
+                suggestion_text.append(f"\n  {idx}. {s}", style=style)
+            renderables.append(suggestion_text)
+
+        console.print(Group(*renderables))
 
     else:
-        print("\n" + "=" * 60)
-        print("EXECUTION SUMMARY")
-        print("=" * 60)
-        print(f"Total Queries:        {len(results)}")
-        print(f"Successful:           {successful}")
-        print(f"Failed:               {failed}")
-        print(f"Slow Queries:         {slow_count}")
-        print(f"Total Execution Time: {total_time:.2f} ms")
+        sep = "=" * 60
+        out = [
+            "\n" + sep,
+            "EXECUTION SUMMARY",
+            sep,
+            f"Total Queries:        {len(results)}",
+            f"Successful:           {successful}",
+            f"Failed:               {failed}",
+            f"Slow Queries:         {slow_count}",
+            f"Total Execution Time: {total_time:.2f} ms",
+        ]
 
         if top_slow:
-            print("\nTop 3 Slowest Queries:")
+            out.append("\nTop 3 Slowest Queries:")
             for r in top_slow:
                 score = f"{r.performance_score}/10" if r.performance_score else "N/A"
                 line_info = f" (line {r.line_number})" if r.line_number else ""
-                print(
+                out.append(
                     f"  #{r.query_number}{line_info}: {r.execution_time_ms:.2f} ms "
-                    f"(Score: {score}) — {truncate_query_text(r.query_text, 60)}"
+                    f"(Score: {score}) — {_truncate(r.query_text, 60)}"
                 )
 
-        print("=" * 60)
+        out.append(sep)
+        _write_block(out)
+
+
+def _dump_json_bytes(obj: Any, indent: bool = False) -> bytes:
+    """Serialize one JSON fragment to UTF-8 bytes.
+
+    Uses orjson when installed, stdlib json otherwise.
+
+    Args:
+        obj: JSON-serializable object.
+        indent: Whether to pretty-print with 2-space indent.
+
+    Returns:
+        Serialized bytes.
+    """
+    if orjson is not None:
+        if indent:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        return orjson.dumps(obj)
+    text = json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
+    return text.encode("utf-8")
 
 
 def save_json_report(results: List[QueryResult], output_path: str) -> None:
@@ -477,39 +667,135 @@ def save_json_report(results: List[QueryResult], output_path: str) -> None:
         results: All query results.
         output_path: Path to the output JSON file.
     """
-    total_time = sum(r.execution_time_ms for r in results)
-    sorted_by_time = sorted(
-        [r for r in results if r.success],
-        key=lambda r: r.execution_time_ms,
-        reverse=True,
-    )
-
-    report = {
-        "summary": {
-            "total_queries": len(results),
-            "successful": sum(1 for r in results if r.success),
-            "failed": sum(1 for r in results if not r.success),
-            "slow_queries": sum(1 for r in results if r.is_slow),
-            "total_execution_time_ms": round(total_time, 2),
-            "top_3_slowest": [
-                {
-                    "query_number": r.query_number,
-                    "execution_time_ms": round(r.execution_time_ms, 2),
-                    "query_text": truncate_query_text(r.query_text, 200),
-                }
-                for r in sorted_by_time[:3]
-            ],
-        },
-        "queries": [r.to_dict() for r in results],
+    stats, top_slow = _prepare_report_data(results)
+
+    summary = {
+        "total_queries": stats.total_queries,
+        "successful": stats.successful,
+        "failed": stats.failed,
+        "slow_queries": stats.slow,
+        "total_execution_time_ms": round(stats.total_time_ms, 2),
+        "top_3_slowest": [
+            {
+                "query_number": r.query_number,
+                "execution_time_ms": round(r.execution_time_ms, 2),
+                "query_text": _truncate(r.query_text, 200),
+            }
+            for r in top_slow
+        ],
     }
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(report, f, indent=2, ensure_ascii=False)
+    # Stream the queries array one element at a time instead of
+    # materializing every to_dict() plus the serialized report in
+    # memory at once — peak RSS stays flat regardless of run size.
+    with open(output_path, "wb") as f:
+        f.write(b'{"summary": ')
+        f.write(_dump_json_bytes(summary, indent=True))
+        f.write(b', "queries": [')
+        for idx, r in enumerate(results):
+            if idx:
+                f.write(b", ")
+            f.write(_dump_json_bytes(r.to_dict()))
+        f.write(b"]}")
 
     logger.info("JSON report saved to: %s", output_path)
     console.print(f"[green]JSON report saved to: {output_path}[/green]")
 
 
+# CSV header, in the exact order _csv_row emits its values.
+_CSV_FIELDNAMES = (
+    "query_number",
+    "line_number",
+    "query_type",
+    "execution_time_ms",
+    "rows_affected",
+    "success",
+    "error_message",
+    "performance_score",
+    "is_slow",
+    "warnings",
+    "suggestions",
+    "query_text",
+)
+
+
+# Bound once — saves a str-method lookup per joined cell per row.
+_join_semi = "; ".join
+
+
+def _csv_row(r: QueryResult) -> tuple:
+    """Build one CSV row for a query result, in _CSV_FIELDNAMES order.
+
+    Args:
+        r: The query result.
+
+    Returns:
+        Row tuple matching the header column order.
+    """
+    return (
+        r.query_number,
+        r.line_number,
+        r.query_type,
+        round(r.execution_time_ms, 2),
+        r.rows_affected,
+        r.success,
+        r.error_message or "",
+        r.performance_score or "",
+        r.is_slow,
+        _join_semi(r.warnings),
+        _join_semi(r.suggestions),
+        _truncate(r.query_text, 200),
+    )
+
+
+class CSVReportWriter:
+    """Streaming CSV writer that appends result batches to one file.
+
+    Keeps a single large-buffered file handle and csv.writer alive
+    across write() calls, so reports emitted periodically (or in
+    chunks on very large runs) don't reopen the file and rebuild the
+    writer each time. Rows go through writerows — the csv module's C
+    loop — and the header is written only when starting a new file.
+    """
+
+    def __init__(self, output_path: str, append: bool = False):
+        """Open the report file.
+
+        Args:
+            output_path: Path to the output CSV file.
+            append: Continue an existing report instead of truncating.
+        """
+        mode = "a" if append else "w"
+        self._file = open(
+            output_path, mode, encoding="utf-8", newline="", buffering=1 << 20
+        )
+        self._writer = csv.writer(self._file)
+        if self._file.tell() == 0:
+            self._writer.writerow(_CSV_FIELDNAMES)
+
+    def write(self, results: List[QueryResult]) -> None:
+        """Append one batch of results as CSV rows.
+
+        Args:
+            results: Query results to append.
+        """
+        self._writer.writerows(_csv_row(r) for r in results)
+
+    def close(self) -> None:
+        """Flush buffered rows to disk and close the file."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+
+    def __enter__(self) -> "CSVReportWriter":
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit context manager and close the file."""
+        self.close()
+
+
 def save_csv_report(results: List[QueryResult], output_path: str) -> None:
     """Save performance report as CSV file.
 
@@ -517,41 +803,8 @@ def save_csv_report(results: List[QueryResult], output_path: str) -> None:
         results: All query results.
         output_path: Path to the output CSV file.
     """
-    fieldnames = [
-        "query_number",
-        "line_number",
-        "query_type",
-        "execution_time_ms",
-        "rows_affected",
-        "success",
-        "error_message",
-        "performance_score",
-        "is_slow",
-        "warnings",
-        "suggestions",
-        "query_text",
-    ]
-
-    with open(output_path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for r in results:
-            row = {
-                "query_number": r.query_number,
-                "line_number": r.line_number,
-                "query_type": r.query_type,
-                "execution_time_ms": round(r.execution_time_ms, 2),
-                "rows_affected": r.rows_affected,
-                "success": r.success,
-                "error_message": r.error_message or "",
-                "performance_score": r.performance_score or "",
-                "is_slow": r.is_slow,
-                "warnings": "; ".join(r.warnings),
-                "suggestions": "; ".join(r.suggestions),
-                "query_text": truncate_query_text(r.query_text, 200),
-            }
-            writer.writerow(row)
+    with CSVReportWriter(output_path) as writer:
+        writer.write(results)
 
     logger.info("CSV report saved to: %s", output_path)
     console.print(f"[green]CSV report saved to: {output_path}[/green]")
@@ -0,0 +1,149 @@
+"""Run-level result cache keyed on SQL file content.
+
+If the analyzed ``.sql`` file and the run configuration are both
+unchanged since a previous run, the full analysis (execution timing,
+EXPLAIN plans, suggestions, AI advice) can be replayed from a cached
+report instead of re-running every query and LLM round-trip.
+
+Replay is only valid for read-only scripts: a file containing DML/DDL
+must actually execute, so callers gate on :func:`is_replayable` first.
+
+Cache entries live in ``~/.cache/sql_analyzer/`` as
+``{sha256(file)}_{config_fingerprint}.json`` and are bypassed with the
+``--force`` CLI flag.
+"""
+
+import dataclasses
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from .executor import QueryResult
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path.home() / ".cache" / "sql_analyzer"
+
+# Statement types (split_queries vocabulary) that leave the database
+# unchanged. Anything outside this set makes a script non-replayable.
+READ_ONLY_TYPES = frozenset({"SELECT", "EXPLAIN"})
+
+
+def is_replayable(queries: List[Tuple[str, int, str]]) -> bool:
+    """Report whether a split script is safe to replay from cache.
+
+    Args:
+        queries: (statement, line_number, query_type) tuples from
+            split_queries().
+
+    Returns:
+        True if every statement is read-only.
+    """
+    return all(qtype in READ_ONLY_TYPES for _, _, qtype in queries)
+
+
+def _config_fingerprint(db_config, analyzer_config) -> str:
+    """Fingerprint the configuration fields that shape the results.
+
+    Covers the database target plus the analyzer settings that change
+    what a run produces — thresholds, EXPLAIN ANALYZE, and the AI
+    backend/model/enablement — so flipping any of them invalidates the
+    entry. The enabled flags matter independently of ai_backend:
+    --ai flips openai_enabled without touching the backend name, and a
+    report generated without AI advice must not be replayed for a run
+    that asked for it. API keys participate only as presence — the key
+    text itself has no business in a cache file name's inputs.
+    """
+    relevant = (
+        repr(db_config),
+        analyzer_config.explain_analyze,
+        analyzer_config.slow_query_threshold_ms,
+        analyzer_config.interest_threshold_ms,
+        analyzer_config.force_ai,
+        analyzer_config.ai_backend,
+        analyzer_config.openai_enabled,
+        analyzer_config.openai_model,
+        bool(analyzer_config.openai_api_key),
+        analyzer_config.ollama_enabled,
+        analyzer_config.ollama_model,
+        analyzer_config.groq_enabled,
+        analyzer_config.groq_model,
+        bool(analyzer_config.groq_api_key),
+    )
+    return hashlib.sha1(repr(relevant).encode("utf-8")).hexdigest()[:8]
+
+
+def cache_path(sql_file: str, db_config, analyzer_config) -> Path:
+    """Build the cache file path for a (sql file, configuration) pair.
+
+    Args:
+        sql_file: Path to the .sql file being analyzed.
+        db_config: DatabaseConfig for this run.
+        analyzer_config: AnalyzerConfig for this run.
+
+    Returns:
+        Path of the cache entry (parent directories not created).
+    """
+    digest = hashlib.sha256(Path(sql_file).read_bytes()).hexdigest()
+    cfg_fp = _config_fingerprint(db_config, analyzer_config)
+    return CACHE_DIR / f"{digest}_{cfg_fp}.json"
+
+
+def load_cached_results(
+    sql_file: str,
+    db_config,
+    analyzer_config,
+) -> Optional[List[QueryResult]]:
+    """Load cached results for an unchanged (sql file, configuration) pair.
+
+    Args:
+        sql_file: Path to the .sql file being analyzed.
+        db_config: DatabaseConfig for this run.
+        analyzer_config: AnalyzerConfig for this run.
+
+    Returns:
+        Reconstructed QueryResult list, or None if no valid entry exists.
+    """
+    try:
+        path = cache_path(sql_file, db_config, analyzer_config)
+    except OSError:
+        return None
+
+    if not path.exists():
+        return None
+
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        results = [QueryResult(**entry) for entry in data["results"]]
+    except (json.JSONDecodeError, KeyError, TypeError, OSError) as e:
+        logger.warning("Ignoring unreadable run cache %s: %s", path, e)
+        return None
+
+    logger.info("Loaded %d cached results from %s", len(results), path)
+    return results
+
+
+def save_cached_results(
+    sql_file: str,
+    db_config,
+    analyzer_config,
+    results: List[QueryResult],
+) -> None:
+    """Persist results for reuse by identical future runs.
+
+    Args:
+        sql_file: Path to the .sql file that was analyzed.
+        db_config: DatabaseConfig for this run.
+        analyzer_config: AnalyzerConfig for this run.
+        results: Completed QueryResult objects.
+    """
+    try:
+        path = cache_path(sql_file, db_config, analyzer_config)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"results": [dataclasses.asdict(r) for r in results]}
+        path.write_text(json.dumps(payload), encoding="utf-8")
+        logger.info("Saved run cache to %s", path)
+    except OSError as e:
+        logger.warning("Could not save run cache: %s", e)
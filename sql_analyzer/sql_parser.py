@@ -4,15 +4,37 @@ Handles multiline queries, semicolon splitting, and comment stripping.
 Uses sqlparse for robust SQL parsing.
 """
 
+import functools
 import logging
 import re
 from pathlib import Path
 from typing import Dict, List, Tuple
 
-import sqlparse
-
 logger = logging.getLogger(__name__)
 
+# sqlparse is imported on first parse rather than at module load — its
+# import chain is heavy enough to show up in CLI startup, and modes
+# like --help never parse any SQL.
+_sqlparse = None
+
+
+def _get_sqlparse():
+    """Return the sqlparse module, importing it on first use."""
+    global _sqlparse
+    if _sqlparse is None:
+        import sqlparse
+
+        _sqlparse = sqlparse
+    return _sqlparse
+
+# Whitespace-collapse pattern for display truncation, compiled once —
+# re.sub(r"\s+", ...) pays a cache lookup per call on this hot path.
+_WS_RE = re.compile(r"\s+")
+
+# First non-blank line of a statement: skip leading whitespace (blank
+# lines included), capture up to the next newline.
+_FIRST_NONBLANK_RE = re.compile(r"\s*(\S[^\n]*)")
+
 
 def load_sql_file(file_path: str) -> str:
     """Load a SQL file and return its contents as a string.
@@ -54,10 +76,10 @@ def strip_comments(sql: str) -> str:
         SQL string with comments removed.
     """
     # Use sqlparse to format and strip comments
-    return sqlparse.format(sql, strip_comments=True)
+    return _get_sqlparse().format(sql, strip_comments=True)
 
 
-def split_queries(sql_content: str) -> List[Tuple[str, int]]:
+def split_queries(sql_content: str) -> List[Tuple[str, int, str]]:
     """Split a SQL script into individual executable statements with line numbers.
 
     Handles:
@@ -70,8 +92,10 @@ def split_queries(sql_content: str) -> List[Tuple[str, int]]:
         sql_content: Raw SQL content from the file.
 
     Returns:
-        List of (sql_statement, line_number) tuples.
-        line_number is the 1-based line in the original file where the statement starts.
+        List of (sql_statement, line_number, query_type) tuples.
+        line_number is the 1-based line in the original file where the
+        statement starts; query_type is classified once here so
+        downstream stages don't re-parse the statement.
     """
     # Build a map from cleaned-statement text to original line number.
     # We strip comments but need to remember where each statement began
@@ -81,117 +105,141 @@ def split_queries(sql_content: str) -> List[Tuple[str, int]]:
     # Strip comments for parsing
     clean_sql = strip_comments(sql_content)
 
-    # Parse and split using sqlparse
-    statements = sqlparse.split(clean_sql)
-
-    # For each cleaned statement, find its starting line in the original file.
-    # We walk through the original content character-by-character to correlate.
-    clean_lines = clean_sql.splitlines()
+    # Parse once: sqlparse.split would tokenize the script and then
+    # get_query_type would re-parse each statement. Keeping the parsed
+    # statement objects gives us both the text and the type in one pass.
+    parsed_statements = _get_sqlparse().parse(clean_sql)
+
+    # For each cleaned statement, find its starting line in the original
+    # file. sqlparse preserves statement order, so a single forward
+    # cursor over the original lines suffices: each statement's first
+    # meaningful line is searched for from where the previous statement
+    # matched, making the whole correlation one linear pass instead of
+    # a fresh top-to-bottom scan (plus a matched-line set) per
+    # statement. Duplicate statements resolve naturally — the cursor
+    # has already moved past earlier occurrences.
+    cursor = 0
 
-    # Build a mapping: for each line in clean_sql, what is the corresponding
-    # original line number?  After comment stripping, blank lines may shift.
-    # Strategy: search for each statement's first meaningful tokens in the
-    # original content to find the real line number.
     def _find_line_number(stmt_text: str) -> int:
-        """Find the 1-based line number of stmt_text in the original file."""
-        # Get the first non-whitespace line of the statement
-        first_line = ""
-        for line in stmt_text.splitlines():
-            stripped = line.strip()
-            if stripped:
-                first_line = stripped
-                break
+        """Find the 1-based original line of stmt_text, advancing the cursor."""
+        nonlocal cursor
+        # Get the first non-whitespace line of the statement without
+        # splitting the whole text into a line list.
+        m = _FIRST_NONBLANK_RE.match(stmt_text)
+        first_line = m.group(1).rstrip() if m else ""
 
         if not first_line:
             return 1
 
-        # Search for this line in the original file content
-        for idx, orig_line in enumerate(original_lines):
-            if first_line in orig_line:
+        for idx in range(cursor, len(original_lines)):
+            orig_line = original_lines[idx]
+            # Fast path: statements in well-formatted scripts start at
+            # column 0, so a prefix compare usually settles it without
+            # the full substring scan.
+            if orig_line.startswith(first_line) or first_line in orig_line:
+                cursor = idx + 1
                 return idx + 1  # 1-based
 
-        return 1  # fallback
-
-    # Track which original lines have already been matched (for duplicate statements)
-    matched_lines: set = set()
-
-    def _find_line_number_unique(stmt_text: str) -> int:
-        """Find line number, skipping already-matched lines for duplicates."""
-        first_line = ""
-        for line in stmt_text.splitlines():
-            stripped = line.strip()
-            if stripped:
-                first_line = stripped
-                break
-
-        if not first_line:
-            return 1
-
+        # Fallback: comment stripping occasionally rewrites a line enough
+        # that the in-order scan misses it; retry from the top without
+        # moving the cursor.
         for idx, orig_line in enumerate(original_lines):
-            if first_line in orig_line and idx not in matched_lines:
-                matched_lines.add(idx)
+            if first_line in orig_line:
                 return idx + 1
 
-        return _find_line_number(stmt_text)
+        return 1  # fallback
 
-    # Filter out empty statements, find line numbers
-    queries: List[Tuple[str, int]] = []
-    for stmt in statements:
-        trimmed = stmt.strip()
+    # Filter out empty statements, find line numbers and classify
+    queries: List[Tuple[str, int, str]] = []
+    for stmt in parsed_statements:
+        trimmed = str(stmt).strip()
         # Remove trailing semicolons for cleaner execution
         if trimmed.endswith(";"):
             trimmed = trimmed[:-1].strip()
         if trimmed:
-            line_num = _find_line_number_unique(trimmed)
-            queries.append((trimmed, line_num))
+            line_num = _find_line_number(trimmed)
+            queries.append((trimmed, line_num, _classify_statement(stmt, trimmed)))
 
     logger.info("Split SQL into %d executable statements.", len(queries))
     return queries
 
 
+# Statement types classifiable from the first keyword alone, skipping
+# the sqlparse pass entirely.
+_COMMON_TYPES = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE"})
+
+# First-keyword fallback classification for statements sqlparse can't type.
+_TYPE_MAP = {
+    "SELECT": "SELECT",
+    "INSERT": "INSERT",
+    "UPDATE": "UPDATE",
+    "DELETE": "DELETE",
+    "CREATE": "DDL",
+    "ALTER": "DDL",
+    "DROP": "DDL",
+    "TRUNCATE": "DDL",
+    "BEGIN": "TRANSACTION",
+    "COMMIT": "TRANSACTION",
+    "ROLLBACK": "TRANSACTION",
+    "SET": "SET",
+    "EXPLAIN": "EXPLAIN",
+}
+
+
+def _classify_statement(stmt, text: str) -> str:
+    """Classify an already-parsed sqlparse statement.
+
+    Args:
+        stmt: Parsed sqlparse statement object.
+        text: The trimmed statement text (for the keyword fallback).
+
+    Returns:
+        Query type string, same vocabulary as get_query_type.
+    """
+    stmt_type = stmt.get_type()
+    if stmt_type:
+        return stmt_type.upper()
+    first_token = text.split()[0].upper() if text else ""
+    return _TYPE_MAP.get(first_token, "OTHER")
+
+
+@functools.lru_cache(maxsize=256)
 def get_query_type(query: str) -> str:
     """Determine the type of SQL statement.
 
+    The four common statement types are recognized from the first
+    keyword with plain string operations — a full sqlparse pass costs
+    orders of magnitude more and agrees with this answer anyway.
+    Everything else (CTEs, DDL, comments up front) still goes through
+    sqlparse.
+
+    Memoized: the executor, suggestion engine, and report all classify
+    the same statement text, so repeat calls are a dict hit.
+
     Args:
         query: A single SQL statement.
 
     Returns:
         Query type string (e.g., 'SELECT', 'INSERT', 'UPDATE', 'DELETE', 'DDL', 'OTHER').
     """
-    parsed = sqlparse.parse(query)
+    head = query.lstrip()[:8].split(None, 1)
+    if head and head[0].upper() in _COMMON_TYPES:
+        return head[0].upper()
+
+    parsed = _get_sqlparse().parse(query)
     if not parsed:
         return "OTHER"
 
-    stmt = parsed[0]
-    stmt_type = stmt.get_type()
-
-    if stmt_type:
-        return stmt_type.upper()
-
-    # Fallback: check first keyword
-    first_token = query.strip().split()[0].upper() if query.strip() else ""
-    type_map = {
-        "SELECT": "SELECT",
-        "INSERT": "INSERT",
-        "UPDATE": "UPDATE",
-        "DELETE": "DELETE",
-        "CREATE": "DDL",
-        "ALTER": "DDL",
-        "DROP": "DDL",
-        "TRUNCATE": "DDL",
-        "BEGIN": "TRANSACTION",
-        "COMMIT": "TRANSACTION",
-        "ROLLBACK": "TRANSACTION",
-        "SET": "SET",
-        "EXPLAIN": "EXPLAIN",
-    }
-
-    return type_map.get(first_token, "OTHER")
+    return _classify_statement(parsed[0], query.strip())
 
 
+@functools.lru_cache(maxsize=4096)
 def truncate_query_text(query: str, max_length: int = 200) -> str:
     """Truncate query text for display purposes.
 
+    Memoized: the console, JSON, and CSV report paths each truncate
+    the same query text at the same handful of widths.
+
     Args:
         query: Full SQL query text.
         max_length: Maximum character length for display.
@@ -200,7 +248,7 @@ def truncate_query_text(query: str, max_length: int = 200) -> str:
         Truncated query text with ellipsis if needed.
     """
     # Normalize whitespace
-    normalized = re.sub(r"\s+", " ", query).strip()
+    normalized = _WS_RE.sub(" ", query).strip()
     if len(normalized) <= max_length:
         return normalized
     return normalized[:max_length] + "..."
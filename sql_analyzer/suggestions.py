@@ -4,15 +4,103 @@ Generates actionable performance improvement suggestions based on
 query type and EXPLAIN plan analysis results.
 """
 
+import functools
 import logging
 import re
 from typing import List
 
-from .plan_analyzer import PlanMetrics
+from .plan_analyzer import PlanIssue, PlanMetrics
 from .sql_parser import get_query_type
 
 logger = logging.getLogger(__name__)
 
+# Patterns compiled once at import — inline re.search/re.findall calls
+# pay the re module's cache lookup (pattern hashing included) on every
+# invocation, and this module runs for each analyzed statement.
+# Case-sensitive like the column pattern below: every caller passes
+# already-uppercased text, so the engine compares exact characters.
+_WHERE_CLAUSE_RE = re.compile(
+    r"\bWHERE\b\s+(?P<body>.*?)(?:\bGROUP\b|\bORDER\b|\bLIMIT\b|\bHAVING\b|\Z)",
+    re.DOTALL,
+)
+
+# Keywords _analyze_select probes for, found in one alternation scan
+# instead of a separate full-text search per keyword.
+_SELECT_TOKEN_RE = re.compile(r"\b(WHERE|JOIN|LIMIT|TOP)\b")
+# Keywords that look like column references in WHERE-clause patterns.
+_SQL_KEYWORDS = frozenset({
+    "AND", "OR", "NOT", "NULL", "TRUE", "FALSE", "IN", "LIKE",
+    "BETWEEN", "IS", "EXISTS", "ANY", "ALL", "SOME",
+})
+
+# The negative lookahead rejects keywords inside the single C-level
+# scan, so findall returns only real column names and no Python-level
+# filter loop runs afterwards. Case-sensitive: the input is uppercased
+# once before matching, sparing the engine a case-fold per character.
+# Operator alternatives run longest-first so two-char operators match
+# without first trying (and rejecting) their one-char prefixes.
+_WHERE_COLUMN_RE = re.compile(
+    r"\b(?!(?:" + "|".join(sorted(_SQL_KEYWORDS)) + r")\b)"
+    r"([A-Z_]\w*(?:\.\w+)?)\s*"
+    r"(?:<>|!=|>=|<=|=|>|<|\bIN\b|\bLIKE\b|\bBETWEEN\b|\bIS\b)"
+)
+
+
+# Canonical warning/suggestion texts. Every emitted list holds
+# references to these shared strings, so identical findings across
+# thousands of analyzed statements never duplicate the message bodies;
+# only the per-query formatted messages (tables, columns, costs) are
+# built at runtime.
+_MSG_SELECT_STAR = (
+    "Avoid SELECT * — specify only the columns you need to reduce I/O"
+)
+_MSG_NO_WHERE = (
+    "No WHERE clause detected — consider adding filters to limit results"
+)
+_MSG_NO_LIMIT = (
+    "Large result set detected — consider using LIMIT to restrict rows"
+)
+_MSG_MISSING_INDEX = (
+    "Missing index likely — filter applied during sequential scan"
+)
+_MSG_BATCH_INSERT = (
+    "Consider batch INSERT operations for better performance "
+    "(e.g., multi-row VALUES or COPY)"
+)
+_MSG_CHECK_TRIGGERS = (
+    "Check for unnecessary triggers that may slow down DML operations"
+)
+_MSG_CHECK_FOREIGN_KEYS = (
+    "Review foreign key constraints — cascading actions can impact performance"
+)
+_MSG_NESTED_LOOP = "Nested Loop Join detected — may be slow on large datasets"
+_MSG_NESTED_LOOP_FIX = (
+    "Verify join conditions have proper indexes to avoid nested loop scans"
+)
+_MSG_HASH_JOIN = (
+    "Hash Join detected — acceptable for large joins but uses more memory"
+)
+_MSG_LARGE_SORT = "Large sort operation detected (possibly spilling to disk)"
+_MSG_LARGE_SORT_FIX = (
+    "Add index on ORDER BY / GROUP BY columns to avoid in-memory sorting"
+)
+_MSG_BITMAP_SCAN = "Bitmap Heap Scan detected — partial index usage"
+_MSG_BITMAP_SCAN_FIX = "Consider a more selective index or adjust query filters"
+_MSG_TEMP_DISK = "Temporary disk usage detected — work_mem may be too low"
+_MSG_TEMP_DISK_FIX = (
+    "Increase work_mem setting or optimize query to reduce data volume"
+)
+
+# Memo for generate_suggestions: dashboards and ORM workloads repeat
+# the same statements, and the whole analysis is pure given the
+# metrics, so repeat queries skip every regex below. Keyed on the
+# normalized query plus the metrics fields the analyzers read; capped
+# rather than LRU-evicted to keep lookups a plain dict hit (concurrent
+# access from the executor's worker threads is safe — at worst two
+# threads compute the same entry once).
+_CACHE_MAX = 4096
+_suggestion_cache: dict = {}
+
 
 def generate_suggestions(
     query: str,
@@ -21,6 +109,9 @@ def generate_suggestions(
 ) -> tuple[List[str], List[str]]:
     """Generate performance warnings and suggestions for a query.
 
+    Results are memoized per (normalized query, threshold, metrics);
+    fresh lists are returned so callers may append to them.
+
     Args:
         query: The SQL query text.
         metrics: Plan analysis metrics.
@@ -29,6 +120,73 @@ def generate_suggestions(
     Returns:
         Tuple of (warnings, suggestions).
     """
+    # Case-fold (and collapse whitespace) once — it normalizes
+    # formatting-only variants onto one cache entry, and both
+    # analyzers probe the same uppercase text.
+    query_upper = " ".join(query.split()).upper()
+
+    key = (
+        query_upper,
+        slow_threshold_ms,
+        metrics.execution_time_ms,
+        metrics.total_cost,
+        metrics.estimated_rows,
+        metrics.actual_rows,
+        metrics.issues,
+        tuple(metrics.tables_scanned),
+    )
+    cached = _suggestion_cache.get(key)
+    if cached is None:
+        cached = _generate_suggestions(query, query_upper, metrics, slow_threshold_ms)
+        if len(_suggestion_cache) < _CACHE_MAX:
+            _suggestion_cache[key] = cached
+    return list(cached[0]), list(cached[1])
+
+
+def generate_suggestions_batch(
+    queries: List[str],
+    metrics_list: List[PlanMetrics],
+    slow_threshold_ms: float = 500.0,
+) -> "List[tuple[List[str], List[str]]]":
+    """Generate warnings and suggestions for many queries at once.
+
+    A convenience for log-analysis callers iterating (query, metrics)
+    pairs; repeated statements — the common case in captured workloads
+    — collapse onto the shared memo, so each distinct normalized query
+    is analyzed once per batch.
+
+    Args:
+        queries: SQL query texts.
+        metrics_list: Plan metrics, parallel to queries.
+        slow_threshold_ms: Threshold for slow query warning (ms).
+
+    Returns:
+        List of (warnings, suggestions) pairs, parallel to queries.
+    """
+    return [
+        generate_suggestions(query, metrics, slow_threshold_ms)
+        for query, metrics in zip(queries, metrics_list)
+    ]
+
+
+def _generate_suggestions(
+    query: str,
+    query_upper: str,
+    metrics: PlanMetrics,
+    slow_threshold_ms: float,
+) -> tuple:
+    """Run the analyzers and return immutable (warnings, suggestions).
+
+    Args:
+        query: The SQL query text.
+        query_upper: Whitespace-collapsed uppercase form of the query.
+        metrics: Plan analysis metrics.
+        slow_threshold_ms: Threshold for slow query warning (ms).
+
+    Returns:
+        Tuple of (warnings, suggestions) as tuples, safe to share
+        between cache hits.
+    """
     warnings: List[str] = []
     suggestions: List[str] = []
 
@@ -41,98 +199,112 @@ def generate_suggestions(
             f"exceeds threshold of {slow_threshold_ms:.0f} ms"
         )
 
-    # Query-type-specific analysis
-    if query_type == "SELECT":
-        _analyze_select(query, metrics, warnings, suggestions)
-    elif query_type in ("INSERT", "UPDATE", "DELETE"):
-        _analyze_dml(query, query_type, metrics, warnings, suggestions)
+    # Query-type-specific analysis — each analyzer returns its own
+    # (warnings, suggestions) pair, folded in with one extend apiece.
+    # One dict lookup dispatches instead of a string-compare ladder.
+    analyzer = _ANALYZERS.get(query_type)
+    if analyzer is not None:
+        w, s = analyzer(query, query_upper, metrics=metrics)
+        warnings.extend(w)
+        suggestions.extend(s)
 
     # General suggestions based on plan metrics
-    _analyze_plan_metrics(metrics, warnings, suggestions)
+    w, s = _analyze_plan_metrics(metrics)
+    warnings.extend(w)
+    suggestions.extend(s)
 
-    return warnings, suggestions
+    return tuple(warnings), tuple(suggestions)
 
 
 def _analyze_select(
     query: str,
+    query_upper: str,
     metrics: PlanMetrics,
-    warnings: List[str],
-    suggestions: List[str],
-) -> None:
+) -> "tuple[List[str], List[str]]":
     """Analyze SELECT query for performance issues.
 
     Args:
         query: SELECT query text.
+        query_upper: Whitespace-collapsed uppercase form of the query.
         metrics: Plan metrics.
-        warnings: List to append warnings to.
-        suggestions: List to append suggestions to.
+
+    Returns:
+        Tuple of (warnings, suggestions) for this query.
     """
-    query_upper = query.strip().upper()
+    warnings: List[str] = []
+    suggestions: List[str] = []
 
     # Detect SELECT *
-    if re.search(r"SELECT\s+\*", query_upper):
-        suggestions.append(
-            "Avoid SELECT * — specify only the columns you need to reduce I/O"
-        )
+    if "SELECT *" in query_upper:
+        suggestions.append(_MSG_SELECT_STAR)
+
+    # One alternation scan collects every keyword the checks below
+    # care about, instead of four separate full-text searches.
+    present = set(_SELECT_TOKEN_RE.findall(query_upper))
 
     # Check for missing WHERE clause
-    if "WHERE" not in query_upper and "JOIN" not in query_upper:
-        suggestions.append(
-            "No WHERE clause detected — consider adding filters to limit results"
-        )
+    if "WHERE" not in present and "JOIN" not in present:
+        suggestions.append(_MSG_NO_WHERE)
 
     # Suggest LIMIT for potentially large result sets
-    if "LIMIT" not in query_upper and "TOP" not in query_upper:
+    if "LIMIT" not in present and "TOP" not in present:
         if metrics.estimated_rows > 1000 or metrics.actual_rows > 1000:
-            suggestions.append(
-                "Large result set detected — consider using LIMIT to restrict rows"
-            )
-
-    # Sequential scan warnings
-    if metrics.has_sequential_scan:
-        for table in metrics.tables_scanned:
-            warnings.append(f"Sequential Scan detected on table '{table}'")
+            suggestions.append(_MSG_NO_LIMIT)
+
+    # Read the issue bitfield once — each has_* property is a
+    # descriptor call, and two flags are tested below.
+    issues = metrics.issues
+
+    # Sequential scan warnings — extend with a generator, one bulk
+    # call instead of an append per table/column.
+    if issues & PlanIssue.SEQUENTIAL_SCAN:
+        warnings.extend(
+            f"Sequential Scan detected on table '{table}'"
+            for table in metrics.tables_scanned
+        )
 
-        # Extract filter columns for index suggestion
-        filter_cols = _extract_where_columns(query)
-        for col in filter_cols:
-            suggestions.append(
+        # Extract filter columns for index suggestion — but only run
+        # the regex machinery when a WHERE clause exists at all.
+        if "WHERE" in present:
+            suggestions.extend(
                 f"Create index on filtered column: {col}"
+                for col in _extract_where_columns(query_upper)
             )
 
     # Missing index
-    if metrics.missing_index_likely:
-        warnings.append("Missing index likely — filter applied during sequential scan")
+    if issues & PlanIssue.MISSING_INDEX:
+        warnings.append(_MSG_MISSING_INDEX)
 
     # High cost warning
     if metrics.total_cost > 10000:
         warnings.append(f"High cost query: estimated cost = {metrics.total_cost:.1f}")
 
+    return warnings, suggestions
+
 
 def _analyze_dml(
     query: str,
+    query_upper: str,
     query_type: str,
     metrics: PlanMetrics,
-    warnings: List[str],
-    suggestions: List[str],
-) -> None:
+) -> "tuple[List[str], List[str]]":
     """Analyze INSERT/UPDATE/DELETE query for performance issues.
 
     Args:
         query: DML query text.
+        query_upper: Whitespace-collapsed uppercase form of the query.
         query_type: 'INSERT', 'UPDATE', or 'DELETE'.
         metrics: Plan metrics.
-        warnings: List to append warnings to.
-        suggestions: List to append suggestions to.
+
+    Returns:
+        Tuple of (warnings, suggestions) for this query.
     """
-    query_upper = query.strip().upper()
+    warnings: List[str] = []
+    suggestions: List[str] = []
 
     # Suggest batch operations for INSERT
     if query_type == "INSERT":
-        suggestions.append(
-            "Consider batch INSERT operations for better performance "
-            "(e.g., multi-row VALUES or COPY)"
-        )
+        suggestions.append(_MSG_BATCH_INSERT)
 
     # Check UPDATE/DELETE without WHERE
     if query_type in ("UPDATE", "DELETE") and "WHERE" not in query_upper:
@@ -140,112 +312,103 @@ def _analyze_dml(
             f"{query_type} without WHERE clause — this affects ALL rows in the table"
         )
 
-    # Indexing suggestion for WHERE columns in UPDATE/DELETE
+    # Indexing suggestion for WHERE columns in UPDATE/DELETE — the
+    # membership test above already gates the regex extraction.
     if query_type in ("UPDATE", "DELETE") and "WHERE" in query_upper:
-        filter_cols = _extract_where_columns(query)
-        for col in filter_cols:
-            suggestions.append(
-                f"Ensure index exists on WHERE column: {col}"
-            )
+        suggestions.extend(
+            f"Ensure index exists on WHERE column: {col}"
+            for col in _extract_where_columns(query_upper)
+        )
 
     # Trigger warning
-    suggestions.append(
-        "Check for unnecessary triggers that may slow down DML operations"
-    )
+    suggestions.append(_MSG_CHECK_TRIGGERS)
 
     # Foreign key constraint check
-    suggestions.append(
-        "Review foreign key constraints — cascading actions can impact performance"
-    )
+    suggestions.append(_MSG_CHECK_FOREIGN_KEYS)
+
+    return warnings, suggestions
+
+
+# Query type → analyzer, bound once at import. The DML entries carry
+# their type via partial so every analyzer shares the
+# (query, query_upper, metrics) calling convention.
+_ANALYZERS = {
+    "SELECT": _analyze_select,
+    "INSERT": functools.partial(_analyze_dml, query_type="INSERT"),
+    "UPDATE": functools.partial(_analyze_dml, query_type="UPDATE"),
+    "DELETE": functools.partial(_analyze_dml, query_type="DELETE"),
+}
 
 
 def _analyze_plan_metrics(
     metrics: PlanMetrics,
-    warnings: List[str],
-    suggestions: List[str],
-) -> None:
+) -> "tuple[List[str], List[str]]":
     """Generate warnings and suggestions from plan-level metrics.
 
     Args:
         metrics: Plan analysis metrics.
-        warnings: List to append warnings to.
-        suggestions: List to append suggestions to.
+
+    Returns:
+        Tuple of (warnings, suggestions) from the plan metrics.
     """
+    warnings: List[str] = []
+    suggestions: List[str] = []
+
+    # One bitfield read replaces five has_* property calls.
+    issues = metrics.issues
+
     # Nested loop warning
-    if metrics.has_nested_loop:
-        warnings.append("Nested Loop Join detected — may be slow on large datasets")
-        suggestions.append(
-            "Verify join conditions have proper indexes to avoid nested loop scans"
-        )
+    if issues & PlanIssue.NESTED_LOOP:
+        warnings.append(_MSG_NESTED_LOOP)
+        suggestions.append(_MSG_NESTED_LOOP_FIX)
 
     # Hash join note
-    if metrics.has_hash_join:
-        warnings.append(
-            "Hash Join detected — acceptable for large joins but uses more memory"
-        )
+    if issues & PlanIssue.HASH_JOIN:
+        warnings.append(_MSG_HASH_JOIN)
 
     # Large sort
-    if metrics.has_large_sort:
-        warnings.append("Large sort operation detected (possibly spilling to disk)")
-        suggestions.append(
-            "Add index on ORDER BY / GROUP BY columns to avoid in-memory sorting"
-        )
+    if issues & PlanIssue.LARGE_SORT:
+        warnings.append(_MSG_LARGE_SORT)
+        suggestions.append(_MSG_LARGE_SORT_FIX)
 
     # Bitmap heap scan
-    if metrics.has_bitmap_heap_scan:
-        warnings.append("Bitmap Heap Scan detected — partial index usage")
-        suggestions.append(
-            "Consider a more selective index or adjust query filters"
-        )
+    if issues & PlanIssue.BITMAP_HEAP_SCAN:
+        warnings.append(_MSG_BITMAP_SCAN)
+        suggestions.append(_MSG_BITMAP_SCAN_FIX)
 
     # Temporary disk usage
-    if metrics.has_temp_disk_usage:
-        warnings.append("Temporary disk usage detected — work_mem may be too low")
-        suggestions.append(
-            "Increase work_mem setting or optimize query to reduce data volume"
-        )
+    if issues & PlanIssue.TEMP_DISK_USAGE:
+        warnings.append(_MSG_TEMP_DISK)
+        suggestions.append(_MSG_TEMP_DISK_FIX)
+
+    return warnings, suggestions
 
 
-def _extract_where_columns(query: str) -> List[str]:
+def _extract_where_columns(query_upper: str) -> List[str]:
     """Extract column names referenced in WHERE clause.
 
     Simple heuristic extraction — not a full SQL parser.
 
     Args:
-        query: SQL query text.
+        query_upper: Uppercased SQL query text — both patterns here
+            are case-sensitive, so the case folding the callers
+            already did serves the match too.
 
     Returns:
         List of column references found in WHERE conditions.
     """
-    columns: List[str] = []
-
     # Find WHERE clause content
-    where_match = re.search(
-        r"\bWHERE\b\s+(.*?)(?:\bGROUP\b|\bORDER\b|\bLIMIT\b|\bHAVING\b|$)",
-        query,
-        re.IGNORECASE | re.DOTALL,
-    )
+    where_match = _WHERE_CLAUSE_RE.search(query_upper)
     if not where_match:
-        return columns
-
-    where_clause = where_match.group(1)
-
-    # Extract column references from common patterns:
-    # column = value, column > value, column IN (...), column LIKE ...
-    col_patterns = re.findall(
-        r"(\b[\w]+(?:\.[\w]+)?)\s*(?:=|!=|<>|>=|<=|>|<|\bIN\b|\bLIKE\b|\bBETWEEN\b|\bIS\b)",
-        where_clause,
-        re.IGNORECASE,
-    )
-
-    # Filter out SQL keywords and values
-    sql_keywords = {
-        "AND", "OR", "NOT", "NULL", "TRUE", "FALSE", "IN", "LIKE",
-        "BETWEEN", "IS", "EXISTS", "ANY", "ALL", "SOME",
-    }
-
-    for col in col_patterns:
-        if col.upper() not in sql_keywords:
-            columns.append(col)
-
-    return list(dict.fromkeys(columns))  # Deduplicate while preserving order
+        return []
+
+    # Column references in common patterns (column = value, column IN
+    # (...), column LIKE ...); the pattern itself excludes keywords,
+    # so all that's left is order-preserving dedup. finditer scans the
+    # WHERE body in place via pos/endpos — no substring copy.
+    return list(dict.fromkeys(
+        m.group(1)
+        for m in _WHERE_COLUMN_RE.finditer(
+            query_upper, where_match.start("body"), where_match.end("body")
+        )
+    ))